@@ -10,51 +10,111 @@ Usage:
     python view_claims.py --stats             # Show statistics
 """
 
+from __future__ import annotations
+
 import argparse
-import json
+import io
 import os
 import sys
+from contextlib import redirect_stdout
 from datetime import datetime
+from functools import lru_cache, wraps
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable
+
+import orjson
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.storage import get_claim_store, StoredClaim
+if TYPE_CHECKING:
+    from src.storage import ClaimSummary, StoredClaim
+
+_LIST_RULE = '─' * 90
+_LIST_HEADER = f"{'Claim ID':<25} {'Status':<15} {'Source':<10} {'Created':<20} {'Claimant':<20}"
+_DETAIL_RULE = '═' * 70
+_STATS_RULE = '═' * 50
 
 
+@lru_cache(maxsize=4096)
 def format_datetime(iso_str: str) -> str:
-    """Format ISO datetime string for display."""
+    """Format ISO datetime string for display (memoized; rows often share timestamps)."""
     try:
+        # Stored timestamps are canonical isoformat(); slice instead of parsing
+        if (
+            len(iso_str) >= 19 and iso_str[10] == "T"
+            and iso_str[4] == iso_str[7] == "-" and iso_str[13] == iso_str[16] == ":"
+        ):
+            return f"{iso_str[:10]} {iso_str[11:19]}"
         dt = datetime.fromisoformat(iso_str)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except:
+    except (TypeError, ValueError):
         return iso_str
 
 
-def print_claim_list(claims: list):
-    """Print a table of claims."""
-    if not claims:
+def print_claim_list(claims: Iterable[ClaimSummary]):
+    """Print a table of claims, streaming rows as they are read."""
+    claims = iter(claims)
+    first = next(claims, None)
+    if first is None:
         print("\nNo claims found.")
         return
     
-    print(f"\n{'─' * 90}")
-    print(f"{'Claim ID':<25} {'Status':<15} {'Source':<10} {'Created':<20} {'Claimant':<20}")
-    print(f"{'─' * 90}")
-    
-    for claim in claims:
-        claimant_name = claim.claimant.get("name", "Unknown")[:18]
-        created = format_datetime(claim.created_at)[:19]
-        print(f"{claim.claim_id:<25} {claim.status:<15} {claim.source:<10} {created:<20} {claimant_name:<20}")
-    
-    print(f"{'─' * 90}")
-    print(f"Total: {len(claims)} claim(s)")
+    write = sys.stdout.write
+    write(f"\n{_LIST_RULE}\n{_LIST_HEADER}\n{_LIST_RULE}\n")
+    count = 0
+    for count, claim in enumerate(chain((first,), claims), 1):
+        # str.ljust is cheaper than format specs in this per-row loop
+        write(
+            f"{claim.claim_id.ljust(25)} {claim.status.ljust(15)} {claim.source.ljust(10)} "
+            f"{format_datetime(claim.created_at)[:19].ljust(20)} {(claim.claimant_name or 'Unknown')[:18].ljust(20)}\n"
+        )
+    write(f"{_LIST_RULE}\nTotal: {count} claim(s)\n")
+
+
+def _truncate_description(value) -> str:
+    text = str(value)
+    return f"{text[:60]}..." if len(text) > 60 else text
+
+
+# Per-section display formatters for specific keys
+_INCIDENT_FORMATTERS = {"incident_description": _truncate_description}
+_DAMAGE_FORMATTERS = {"estimated_repair_cost": lambda value: f"${value:,.2f}"}
 
 
+def _buffered_output(func):
+    """Collect a printer's output and emit it with a single stdout write."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            result = func(*args, **kwargs)
+        sys.stdout.write(buf.getvalue())
+        return result
+    return wrapper
+
+
+def _print_section(title: str, data: dict, empty_message: str, formatters: dict | None = None):
+    """Print a claim section's truthy fields (one write per section)."""
+    lines = [f"\n{title}"]
+    if data:
+        formatters = formatters or {}
+        lines.extend(
+            f"   {key}: {formatters[key](value) if key in formatters else value}"
+            for key, value in data.items()
+            if value
+        )
+    else:
+        lines.append(f"   ({empty_message})")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+@_buffered_output
 def print_claim_detail(claim: StoredClaim):
     """Print detailed view of a single claim."""
-    print(f"\n{'═' * 70}")
+    print(f"\n{_DETAIL_RULE}")
     print(f"  CLAIM DETAILS: {claim.claim_id}")
-    print(f"{'═' * 70}")
+    print(_DETAIL_RULE)
     
     # Status & Metadata
     print(f"\n📋 STATUS & METADATA")
@@ -69,47 +129,10 @@ def print_claim_detail(claim: StoredClaim):
     if claim.notes:
         print(f"   Notes:      {claim.notes}")
     
-    # Claimant
-    print(f"\n👤 CLAIMANT")
-    if claim.claimant:
-        for key, value in claim.claimant.items():
-            if value:
-                print(f"   {key}: {value}")
-    else:
-        print("   (No claimant data)")
-    
-    # Incident
-    print(f"\n🔥 INCIDENT")
-    if claim.incident:
-        for key, value in claim.incident.items():
-            if value:
-                if key == "incident_description" and len(str(value)) > 60:
-                    print(f"   {key}: {str(value)[:60]}...")
-                else:
-                    print(f"   {key}: {value}")
-    else:
-        print("   (No incident data)")
-    
-    # Property Damage
-    print(f"\n🏠 PROPERTY DAMAGE")
-    if claim.property_damage:
-        for key, value in claim.property_damage.items():
-            if value:
-                if key == "estimated_repair_cost":
-                    print(f"   {key}: ${value:,.2f}")
-                else:
-                    print(f"   {key}: {value}")
-    else:
-        print("   (No property damage data)")
-    
-    # Evidence
-    print(f"\n📎 EVIDENCE")
-    if claim.evidence:
-        for key, value in claim.evidence.items():
-            if value:
-                print(f"   {key}: {value}")
-    else:
-        print("   (No evidence data)")
+    _print_section("👤 CLAIMANT", claim.claimant, "No claimant data")
+    _print_section("🔥 INCIDENT", claim.incident, "No incident data", _INCIDENT_FORMATTERS)
+    _print_section("🏠 PROPERTY DAMAGE", claim.property_damage, "No property damage data", _DAMAGE_FORMATTERS)
+    _print_section("📎 EVIDENCE", claim.evidence, "No evidence data")
     
     # Processing Results
     if claim.validation_result or claim.fraud_result or claim.routing_result:
@@ -140,36 +163,33 @@ def print_claim_detail(claim: StoredClaim):
             print(f"      Priority: {rr.get('priority', 'N/A')}")
             print(f"      Reason: {rr.get('reason', 'N/A')}")
     
-    print(f"\n{'═' * 70}")
+    print(f"\n{_DETAIL_RULE}")
 
 
+@_buffered_output
 def print_stats(store):
     """Print database statistics."""
-    total = store.count()
+    stats = store.summary()
     
-    print(f"\n{'═' * 50}")
+    print(f"\n{_STATS_RULE}")
     print(f"  DATABASE STATISTICS")
-    print(f"{'═' * 50}")
-    print(f"\n  Total Claims: {total}")
+    print(_STATS_RULE)
+    print(f"\n  Total Claims: {stats.total}")
     
     # By status
     print(f"\n  By Status:")
     for status in ["draft", "submitted", "processing", "approved", "denied", "pending_review"]:
-        count = store.count(status=status)
+        count = stats.by_status.get(status, 0)
         if count > 0:
             print(f"    {status}: {count}")
     
     # By source
     print(f"\n  By Source:")
-    claims = store.list_all(limit=1000)
-    sources = {}
-    for c in claims:
-        sources[c.source] = sources.get(c.source, 0) + 1
-    for source, count in sorted(sources.items()):
+    for source, count in sorted(stats.by_source.items()):
         print(f"    {source}: {count}")
     
-    print(f"\n  Database: {store.db_path}")
-    print(f"{'═' * 50}")
+    print(f"\n  Database: {stats.db_path}")
+    print(_STATS_RULE)
 
 
 def export_claim(claim: StoredClaim, format: str = "json"):
@@ -190,7 +210,43 @@ def export_claim(claim: StoredClaim, format: str = "json"):
         "call_sid": claim.call_sid,
         "notes": claim.notes,
     }
-    print(json.dumps(data, indent=2))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
+
+
+def _get_store():
+    # Imported here so --help doesn't load the storage layer
+    from src.storage import get_claim_store
+
+    return get_claim_store()
+
+
+def _do_stats(args):
+    print_stats(_get_store())
+
+
+def _do_detail(args):
+    claim = _get_store().get(args.claim_id)
+    if not claim:
+        print(f"\nClaim not found: {args.claim_id}")
+        sys.exit(1)
+    if args.export:
+        export_claim(claim)
+    else:
+        print_claim_detail(claim)
+
+
+def _do_list(args):
+    claims = _get_store().iter_summaries(
+        status=args.status,
+        source=args.source,
+        limit=args.limit
+    )
+    print_claim_list(claims)
+
+
+_HANDLERS = {"stats": _do_stats, "detail": _do_detail, "list": _do_list}
 
 
 def main():
@@ -204,31 +260,9 @@ def main():
     
     args = parser.parse_args()
     
-    store = get_claim_store()
-    
-    if args.stats:
-        print_stats(store)
-        return
-    
-    if args.claim_id:
-        # View specific claim
-        claim = store.get(args.claim_id)
-        if claim:
-            if args.export:
-                export_claim(claim)
-            else:
-                print_claim_detail(claim)
-        else:
-            print(f"\nClaim not found: {args.claim_id}")
-            sys.exit(1)
-    else:
-        # List claims
-        claims = store.list_all(
-            status=args.status,
-            source=args.source,
-            limit=args.limit
-        )
-        print_claim_list(claims)
+    # --stats takes precedence over a claim ID, which takes precedence over listing
+    mode = "stats" if args.stats else "detail" if args.claim_id else "list"
+    _HANDLERS[mode](args)
 
 
 if __name__ == "__main__":
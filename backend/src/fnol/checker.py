@@ -8,11 +8,12 @@ Analyzes an OperationalLiabilityClaim to:
 """
 
 from datetime import datetime, timedelta
-from typing import List
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-from .schema import OperationalLiabilityClaim, IncidentType, AssetType, ImpactSeverity
+from .schema import OperationalLiabilityClaim, IncidentType, AssetType, ImpactSeverity, Provenance
 
 
 class CheckReport(BaseModel):
@@ -60,211 +61,226 @@ class CheckReport(BaseModel):
         }
 
 
-def check_claim(claim: OperationalLiabilityClaim) -> CheckReport:
-    """
-    Analyze a claim for completeness and consistency.
-
-    Args:
-        claim: The OperationalLiabilityClaim to check
-
-    Returns:
-        CheckReport with completeness score, missing evidence, contradictions,
-        and recommended follow-up questions
-    """
-
-    missing_evidence = []
-    contradictions = []
-
-    # ========================================================================
-    # Check Required Evidence (3 tiers)
-    # ========================================================================
-
+# Required evidence items; an item's index is its bit in check_claim's presence mask
+_EVIDENCE_ITEMS = (
     # Tier 1 (Critical - 60% weight)
-    tier1_items = []
-    tier1_present = []
-
-    # System logs (≥1)
-    tier1_items.append("system_logs")
-    if claim.evidence.has_system_logs and claim.evidence.system_log_count >= 1:
-        tier1_present.append("system_logs")
-    else:
-        missing_evidence.append("system_logs")
-
-    # Incident description
-    tier1_items.append("incident_description")
-    if claim.incident.incident_description and claim.incident.incident_description.strip():
-        tier1_present.append("incident_description")
-    else:
-        missing_evidence.append("incident_description")
-
-    # Incident type (not unknown)
-    tier1_items.append("incident_type")
-    if claim.incident.incident_type != IncidentType.UNKNOWN:
-        tier1_present.append("incident_type")
-    else:
-        missing_evidence.append("incident_type")
-
-    # Asset type (not unknown)
-    tier1_items.append("asset_type")
-    if claim.operational_impact.asset_type != AssetType.UNKNOWN:
-        tier1_present.append("asset_type")
-    else:
-        missing_evidence.append("asset_type")
-
+    "system_logs",
+    "incident_description",
+    "incident_type",
+    "asset_type",
     # Tier 2 (Important - 30% weight)
-    tier2_items = []
-    tier2_present = []
-
-    # Incident location (system/node)
-    tier2_items.append("incident_location")
-    if claim.incident.incident_location and claim.incident.incident_location.strip():
-        tier2_present.append("incident_location")
-    else:
-        missing_evidence.append("incident_location")
-
-    # Estimated liability cost
-    tier2_items.append("estimated_liability_cost")
-    if claim.operational_impact.estimated_liability_cost is not None:
-        tier2_present.append("estimated_liability_cost")
-    else:
-        missing_evidence.append("estimated_liability_cost")
-
-    # Incident date
-    tier2_items.append("incident_date")
-    if claim.incident.incident_date is not None:
-        tier2_present.append("incident_date")
-    else:
-        missing_evidence.append("incident_date")
-
+    "incident_location",
+    "estimated_liability_cost",
+    "incident_date",
     # Tier 3 (Supporting - 10% weight)
-    tier3_items = []
-    tier3_present = []
-
-    # Liability assessment document
-    tier3_items.append("liability_assessment")
-    if claim.evidence.has_liability_assessment:
-        tier3_present.append("liability_assessment")
-    else:
-        missing_evidence.append("liability_assessment")
-
-    # System component
-    tier3_items.append("system_component")
-    if claim.operational_impact.system_component and claim.operational_impact.system_component.strip():
-        tier3_present.append("system_component")
-    else:
-        missing_evidence.append("system_component")
-
-    # Multiple logs (≥2)
-    tier3_items.append("multiple_logs")
-    if claim.evidence.system_log_count >= 2:
-        tier3_present.append("multiple_logs")
-    else:
-        missing_evidence.append("multiple_logs")
+    "liability_assessment",
+    "system_component",
+    "multiple_logs",
+)
+_TIER1_MASK = 0b0000001111
+_TIER2_MASK = 0b0001110000
+_TIER3_MASK = 0b1110000000
+_TIER1_SIZE = _TIER1_MASK.bit_count()
+_TIER2_SIZE = _TIER2_MASK.bit_count()
+_TIER3_SIZE = _TIER3_MASK.bit_count()
 
-    # Calculate completeness score
-    tier1_score = (len(tier1_present) / len(tier1_items)) * 0.6 if tier1_items else 0.0
-    tier2_score = (len(tier2_present) / len(tier2_items)) * 0.3 if tier2_items else 0.0
-    tier3_score = (len(tier3_present) / len(tier3_items)) * 0.1 if tier3_items else 0.0
 
-    completeness_score = tier1_score + tier2_score + tier3_score
+# Incidents older than this are flagged as stale
+_MAX_INCIDENT_AGE = timedelta(days=730)  # 2 years
 
-    # ========================================================================
-    # Detect Contradictions
-    # ========================================================================
 
-    # 1. Low confidence (<0.3) on critical fields
-    if claim.incident.incident_type_provenance and claim.incident.incident_type_provenance.confidence < 0.3:
-        contradictions.append("Low confidence on incident type classification (confidence < 0.3)")
+def _low_confidence(provenance: Optional[Provenance]) -> bool:
+    """Whether an extracted field's provenance has confidence below 0.3."""
+    return provenance is not None and provenance.confidence < 0.3
 
-    if claim.operational_impact.asset_type_provenance and claim.operational_impact.asset_type_provenance.confidence < 0.3:
-        contradictions.append("Low confidence on asset type classification (confidence < 0.3)")
 
-    if claim.incident.incident_description_provenance and claim.incident.incident_description_provenance.confidence < 0.3:
-        contradictions.append("Low confidence on incident description extraction (confidence < 0.3)")
+def _incident_date(claim: OperationalLiabilityClaim) -> Optional[datetime]:
+    """Incident date as a datetime, or None if missing or unparseable."""
+    incident_date = claim.incident.incident_date
 
-    # 2. Severity vs cost mismatches
-    severity = claim.operational_impact.impact_severity
-    cost = claim.operational_impact.estimated_liability_cost
+    # Handle string dates (convert to datetime if needed)
+    if isinstance(incident_date, str):
+        try:
+            return datetime.fromisoformat(incident_date.replace('Z', '+00:00').replace('+00:00', ''))
+        except ValueError:
+            # Can't parse date string, skip the date checks
+            return None
+    return incident_date
 
-    if severity == ImpactSeverity.CRITICAL and cost is not None and cost < 5000:
-        contradictions.append(f"Severity marked as CRITICAL but estimated cost is only ${cost:.2f} (expected >$5000)")
 
-    if severity == ImpactSeverity.SEVERE and cost is not None and cost < 1000:
-        contradictions.append(f"Severity marked as SEVERE but estimated cost is only ${cost:.2f} (expected >$1000)")
+def _is_future_date(claim: OperationalLiabilityClaim, now: datetime) -> bool:
+    incident_date = _incident_date(claim)
+    return incident_date is not None and incident_date > now
 
-    if severity == ImpactSeverity.MINOR and cost is not None and cost > 50000:
-        contradictions.append(f"Severity marked as MINOR but estimated cost is ${cost:.2f} (expected <$50000)")
 
-    # 3. No logs but claims incident
-    if not claim.evidence.has_system_logs and claim.incident.incident_description:
-        contradictions.append("Incident description provided but no system logs uploaded")
+def _is_stale_date(claim: OperationalLiabilityClaim, now: datetime) -> bool:
+    incident_date = _incident_date(claim)
+    return incident_date is not None and incident_date < now - _MAX_INCIDENT_AGE
 
-    # 4. High cost (>$25k) without liability assessment
-    if cost is not None and cost > 25000 and not claim.evidence.has_liability_assessment:
-        contradictions.append(f"High estimated cost (${cost:.2f}) but no liability assessment provided")
 
+# Contradiction rules as (applies, message) pairs, checked in order;
+# applies(claim, now) gets the time check_claim started
+_CONTRADICTION_RULES: List[
+    Tuple[Callable[[OperationalLiabilityClaim, datetime], bool], Callable[[OperationalLiabilityClaim], str]]
+] = [
+    # 1. Low confidence (<0.3) on critical fields
+    (
+        lambda c, now: _low_confidence(c.incident.incident_type_provenance),
+        lambda c: "Low confidence on incident type classification (confidence < 0.3)",
+    ),
+    (
+        lambda c, now: _low_confidence(c.operational_impact.asset_type_provenance),
+        lambda c: "Low confidence on asset type classification (confidence < 0.3)",
+    ),
+    (
+        lambda c, now: _low_confidence(c.incident.incident_description_provenance),
+        lambda c: "Low confidence on incident description extraction (confidence < 0.3)",
+    ),
+    # 2. Severity vs cost mismatches
+    (
+        lambda c, now: c.operational_impact.impact_severity == ImpactSeverity.CRITICAL
+        and c.operational_impact.estimated_liability_cost is not None
+        and c.operational_impact.estimated_liability_cost < 5000,
+        lambda c: f"Severity marked as CRITICAL but estimated cost is only ${c.operational_impact.estimated_liability_cost:.2f} (expected >$5000)",
+    ),
+    (
+        lambda c, now: c.operational_impact.impact_severity == ImpactSeverity.SEVERE
+        and c.operational_impact.estimated_liability_cost is not None
+        and c.operational_impact.estimated_liability_cost < 1000,
+        lambda c: f"Severity marked as SEVERE but estimated cost is only ${c.operational_impact.estimated_liability_cost:.2f} (expected >$1000)",
+    ),
+    (
+        lambda c, now: c.operational_impact.impact_severity == ImpactSeverity.MINOR
+        and c.operational_impact.estimated_liability_cost is not None
+        and c.operational_impact.estimated_liability_cost > 50000,
+        lambda c: f"Severity marked as MINOR but estimated cost is ${c.operational_impact.estimated_liability_cost:.2f} (expected <$50000)",
+    ),
+    # 3. No logs but claims incident
+    (
+        lambda c, now: not c.evidence.has_system_logs and bool(c.incident.incident_description),
+        lambda c: "Incident description provided but no system logs uploaded",
+    ),
+    # 4. High cost (>$25k) without liability assessment
+    (
+        lambda c, now: c.operational_impact.estimated_liability_cost is not None
+        and c.operational_impact.estimated_liability_cost > 25000
+        and not c.evidence.has_liability_assessment,
+        lambda c: f"High estimated cost (${c.operational_impact.estimated_liability_cost:.2f}) but no liability assessment provided",
+    ),
     # 5. Incident date in future or >2 years old
-    if claim.incident.incident_date:
-        now = datetime.utcnow()
-        incident_date = claim.incident.incident_date
-
-        # Handle string dates (convert to datetime if needed)
-        if isinstance(incident_date, str):
-            try:
-                incident_date = datetime.fromisoformat(incident_date.replace('Z', '+00:00').replace('+00:00', ''))
-            except ValueError:
-                # Can't parse date string, skip this check
-                incident_date = None
-
-        if incident_date is not None:
-            if incident_date > now:
-                contradictions.append(f"Incident date is in the future: {incident_date.isoformat()}")
-            elif incident_date < now - timedelta(days=730):  # 2 years
-                contradictions.append(f"Incident date is more than 2 years old: {incident_date.isoformat()}")
-
+    (
+        _is_future_date,
+        lambda c: f"Incident date is in the future: {_incident_date(c).isoformat()}",
+    ),
+    (
+        _is_stale_date,
+        lambda c: f"Incident date is more than 2 years old: {_incident_date(c).isoformat()}",
+    ),
     # 6. Location provided but confidence <0.3
-    if claim.incident.incident_location and claim.incident.incident_location_provenance:
-        if claim.incident.incident_location_provenance.confidence < 0.3:
-            contradictions.append("Incident location provided but with very low confidence (confidence < 0.3)")
-
-    # ========================================================================
-    # Generate Recommended Questions (1-3 targeted follow-ups)
-    # ========================================================================
+    (
+        lambda c, now: bool(c.incident.incident_location)
+        and _low_confidence(c.incident.incident_location_provenance),
+        lambda c: "Incident location provided but with very low confidence (confidence < 0.3)",
+    ),
+]
 
-    recommended_questions = []
 
+def _candidate_questions(claim: OperationalLiabilityClaim, missing_evidence: List[str]) -> Iterator[str]:
+    """Yield follow-up questions for a claim, most important first."""
     # Prioritize critical missing items first
     if "system_logs" in missing_evidence:
-        recommended_questions.append("Can you provide system logs or telemetry data from the incident?")
+        yield "Can you provide system logs or telemetry data from the incident?"
 
     if "incident_description" in missing_evidence:
-        recommended_questions.append("Can you describe what happened and how the operational failure occurred?")
+        yield "Can you describe what happened and how the operational failure occurred?"
 
     if "incident_type" in missing_evidence or (
         claim.incident.incident_type == IncidentType.UNKNOWN
-        or (claim.incident.incident_type_provenance and claim.incident.incident_type_provenance.confidence < 0.3)
+        or _low_confidence(claim.incident.incident_type_provenance)
     ):
-        recommended_questions.append("Can you clarify the type of incident? (misroute, delay, loss, data error, prediction failure, pricing error, system outage)")
+        yield "Can you clarify the type of incident? (misroute, delay, loss, data error, prediction failure, pricing error, system outage)"
 
     if "asset_type" in missing_evidence:
-        recommended_questions.append("What type of asset was affected? (shipment, package, container, AI model, sensor, route, etc.)")
+        yield "What type of asset was affected? (shipment, package, container, AI model, sensor, route, etc.)"
 
     # Then important items
     if "incident_location" in missing_evidence:
-        recommended_questions.append("Can you provide the system node, hub ID, or facility where the incident occurred?")
+        yield "Can you provide the system node, hub ID, or facility where the incident occurred?"
 
     if "incident_date" in missing_evidence:
-        recommended_questions.append("When did the incident occur?")
+        yield "When did the incident occur?"
 
     if "estimated_liability_cost" in missing_evidence:
-        recommended_questions.append("Do you have a liability estimate or expected cost range?")
+        yield "Do you have a liability estimate or expected cost range?"
 
     # If severity is unclear or cost seems off
-    if severity == ImpactSeverity.UNKNOWN:
-        recommended_questions.append("How would you describe the impact severity? (minor, moderate, severe, or critical)")
+    if claim.operational_impact.impact_severity == ImpactSeverity.UNKNOWN:
+        yield "How would you describe the impact severity? (minor, moderate, severe, or critical)"
+
+
+def check_claim(claim: OperationalLiabilityClaim) -> CheckReport:
+    """
+    Analyze a claim for completeness and consistency.
+
+    Args:
+        claim: The OperationalLiabilityClaim to check
+
+    Returns:
+        CheckReport with completeness score, missing evidence, contradictions,
+        and recommended follow-up questions
+    """
+
+    # ========================================================================
+    # Check Required Evidence (3 tiers)
+    # ========================================================================
+
+    # One bit per item in _EVIDENCE_ITEMS order
+    evidence = claim.evidence
+    incident = claim.incident
+    impact = claim.operational_impact
+    present = (
+        # Tier 1: system logs (≥1), description, incident type, asset type
+        (evidence.has_system_logs and evidence.system_log_count >= 1)
+        | bool(incident.incident_description and incident.incident_description.strip()) << 1
+        | (incident.incident_type != IncidentType.UNKNOWN) << 2
+        | (impact.asset_type != AssetType.UNKNOWN) << 3
+        # Tier 2: location (system/node), liability cost, date
+        | bool(incident.incident_location and incident.incident_location.strip()) << 4
+        | (impact.estimated_liability_cost is not None) << 5
+        | (incident.incident_date is not None) << 6
+        # Tier 3: liability assessment, system component, multiple logs (≥2)
+        | evidence.has_liability_assessment << 7
+        | bool(impact.system_component and impact.system_component.strip()) << 8
+        | (evidence.system_log_count >= 2) << 9
+    )
+
+    missing_evidence = [
+        item for bit, item in enumerate(_EVIDENCE_ITEMS) if not present >> bit & 1
+    ]
+
+    # Calculate completeness score
+    tier1_score = ((present & _TIER1_MASK).bit_count() / _TIER1_SIZE) * 0.6
+    tier2_score = ((present & _TIER2_MASK).bit_count() / _TIER2_SIZE) * 0.3
+    tier3_score = ((present & _TIER3_MASK).bit_count() / _TIER3_SIZE) * 0.1
+
+    completeness_score = tier1_score + tier2_score + tier3_score
+
+    # ========================================================================
+    # Detect Contradictions
+    # ========================================================================
+
+    # Read the clock once for all date rules
+    now = datetime.utcnow()
+    contradictions = [
+        message(claim) for applies, message in _CONTRADICTION_RULES if applies(claim, now)
+    ]
+
+    # ========================================================================
+    # Generate Recommended Questions (1-3 targeted follow-ups)
+    # ========================================================================
 
-    # Limit to 3 most relevant questions
-    recommended_questions = recommended_questions[:3]
+    # Limit to 3 most relevant questions (later candidates are never evaluated)
+    recommended_questions = list(islice(_candidate_questions(claim, missing_evidence), 3))
 
     return CheckReport(
         completeness_score=completeness_score,
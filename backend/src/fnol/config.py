@@ -18,6 +18,7 @@ class ExtractionConfig:
         api_key: Optional[str] = None,
         max_retries: int = 3,
         timeout: int = 30,
+        cache_enabled: bool = False,
     ):
         """
         Initialize extraction configuration.
@@ -28,10 +29,13 @@ class ExtractionConfig:
             api_key: API key (if None, reads from environment)
             max_retries: Maximum API retry attempts
             timeout: Request timeout in seconds
+            cache_enabled: Reuse the extraction for repeated identical inputs
+                (each hit gets a new claim_id)
         """
         self.llm_provider = llm_provider.lower()
         self.max_retries = max_retries
         self.timeout = timeout
+        self.cache_enabled = cache_enabled
 
         # Set default models
         if llm_model is None:
@@ -59,7 +63,8 @@ class ExtractionConfig:
         """Create config from environment variables."""
         provider = os.getenv("LLM_PROVIDER", "mock")  # Default to mock
         model = os.getenv("LLM_MODEL")
-        return cls(llm_provider=provider, llm_model=model)
+        cache_enabled = os.getenv("EXTRACTION_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+        return cls(llm_provider=provider, llm_model=model, cache_enabled=cache_enabled)
 
     def validate(self) -> bool:
         """Check if configuration is valid."""
@@ -5,8 +5,10 @@ Public API: parse_claim(text, image_paths) -> OperationalLiabilityClaim
 """
 
 import logging
+import os
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .config import ExtractionConfig
 from .fusion import ClaimFusion
@@ -16,6 +18,18 @@ from .text_extractor import create_text_extractor
 
 logger = logging.getLogger(__name__)
 
+# Parsed claims kept per pipeline when config.cache_enabled (least recently used evicted)
+_CLAIM_CACHE_SIZE = 128
+
+
+def _image_fingerprint(path: str) -> Tuple:
+    """Cache key part for an image: its path plus mtime and size, so a replaced file misses."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
 
 class ExtractionPipeline:
     """
@@ -37,11 +51,12 @@ class ExtractionPipeline:
         self.text_extractor = create_text_extractor(self.config)
         self.image_analyzer = create_image_analyzer(use_vision_model=False)
         self.fusion = ClaimFusion()
+        self._cache: "OrderedDict[Tuple, OperationalLiabilityClaim]" = OrderedDict()
 
         logger.info(
-            f"Initialized extraction pipeline with "
-            f"LLM provider: {self.config.llm_provider}, "
-            f"model: {self.config.llm_model}"
+            "Initialized extraction pipeline with LLM provider: %s, model: %s",
+            self.config.llm_provider,
+            self.config.llm_model,
         )
 
     def parse_claim(
@@ -72,31 +87,54 @@ class ExtractionPipeline:
             )
             ```
         """
+        cache_key = None
+        if self.config.cache_enabled:
+            cache_key = (
+                text,
+                tuple(_image_fingerprint(path) for path in image_paths),
+                frozenset(claimant_info.items()) if claimant_info else None,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                logger.debug("Claim extraction cache hit: claim_id=%s", cached.claim_id)
+                # Deep copy: callers (e.g. the state manager) edit claim sections in place.
+                # Each submission is its own claim, so it gets a fresh ID and timestamp.
+                return cached.model_copy(
+                    update={
+                        'claim_id': self.fusion._generate_claim_id(),
+                        'created_at': datetime.utcnow(),
+                    },
+                    deep=True,
+                )
+
         start_time = datetime.utcnow()
 
         logger.info(
-            f"Starting claim extraction: {len(text)} chars text, "
-            f"{len(image_paths)} images"
+            "Starting claim extraction: %d chars text, %d images",
+            len(text),
+            len(image_paths),
         )
 
         # Step 1: Extract structured info from text
         logger.debug("Step 1: Extracting from text...")
         text_extraction = self.text_extractor.extract(text)
         logger.debug(
-            f"Text extraction complete: "
-            f"incident_type={text_extraction.get('incident_type')}, "
-            f"extraction_time={text_extraction.get('extraction_time_ms', 0):.0f}ms"
+            "Text extraction complete: incident_type=%s, extraction_time=%.0fms",
+            text_extraction.get('incident_type'),
+            text_extraction.get('extraction_time_ms', 0),
         )
 
         # Step 2: Analyze images/documents
-        logger.debug(f"Step 2: Analyzing {len(image_paths)} images/documents...")
+        logger.debug("Step 2: Analyzing %d images/documents...", len(image_paths))
         image_results = []
         if image_paths:
             image_results = self.image_analyzer.analyze_batch(image_paths)
             doc_count = sum(1 for r in image_results if r.image_type == 'document')
             logger.debug(
-                f"Document analysis complete: "
-                f"{doc_count}/{len(image_results)} are documents"
+                "Document analysis complete: %d/%d are documents",
+                doc_count,
+                len(image_results),
             )
         else:
             logger.debug("No images/documents provided")
@@ -113,14 +151,19 @@ class ExtractionPipeline:
         total_time_ms = (end_time - start_time).total_seconds() * 1000
 
         logger.info(
-            f"Claim extraction complete: "
-            f"claim_id={claim.claim_id}, "
-            f"total_time={total_time_ms:.0f}ms"
+            "Claim extraction complete: claim_id=%s, total_time=%.0fms",
+            claim.claim_id,
+            total_time_ms,
         )
 
         # Log performance metrics
         self._log_metrics(claim, text_extraction, total_time_ms)
 
+        if cache_key is not None:
+            self._cache[cache_key] = claim.model_copy(deep=True)
+            if len(self._cache) > _CLAIM_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
         return claim
 
     def _log_metrics(
@@ -130,6 +173,8 @@ class ExtractionPipeline:
         total_time_ms: float
     ):
         """Log performance and quality metrics."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         metrics = {
             'total_time_ms': total_time_ms,
             'text_extraction_time_ms': text_extraction.get('extraction_time_ms', 0),
@@ -142,7 +187,7 @@ class ExtractionPipeline:
             'conflict_count': len(claim.consistency.conflict_details),
         }
 
-        logger.info(f"Extraction metrics: {metrics}")
+        logger.info("Extraction metrics: %s", metrics)
 
 
 # Singleton instance for convenience
@@ -6,11 +6,13 @@ Domain: Liability claims arising from AI-powered logistics and tracking system f
 (misroutes, delays, losses, prediction failures, data errors, etc.)
 """
 
+import copy
 from datetime import datetime
 from enum import Enum
+from functools import cache
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 
 
 # ============================================================================
@@ -75,7 +77,11 @@ class Provenance(BaseModel):
     Provenance metadata for an extracted field.
 
     Tracks where the information came from and confidence level.
+    Immutable (and hashable), so one instance can be shared between fields
+    and claims; replace it rather than editing it.
     """
+    model_config = ConfigDict(frozen=True)
+
     source_modality: SourceModality
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence score between 0 and 1")
     pointer: str = Field(description="Reference to source (e.g., 'text_span:0-50', 'image_id:img_001')")
@@ -235,8 +241,8 @@ class OperationalLiabilityClaim(BaseModel):
         return v.strip()
 
     def to_json_schema(self) -> dict:
-        """Export as JSON Schema."""
-        return self.schema()
+        """Export as JSON Schema (generated once per model class; callers get their own copy)."""
+        return copy.deepcopy(_json_schema(type(self)))
 
     def get_missing_evidence(self) -> List[str]:
         """Get list of missing required evidence."""
@@ -249,3 +255,9 @@ class OperationalLiabilityClaim(BaseModel):
     def get_consistency_issues(self) -> List[str]:
         """Get list of consistency issues."""
         return self.consistency.conflict_details
+
+
+@cache
+def _json_schema(model: type[BaseModel]) -> dict:
+    """JSON Schema for a model class, memoized (the schema is static per class)."""
+    return model.schema()
@@ -8,7 +8,7 @@ import json
 import re
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 
 from .config import ExtractionConfig
 from .schema import AssetType, ImpactSeverity, IncidentType, SourceModality
@@ -215,6 +215,64 @@ Return ONLY the JSON object. No explanations, no markdown formatting."""
         }
 
 
+def _mentions(text: str, keywords: Tuple[Union[str, Tuple[str, ...]], ...]) -> bool:
+    """Whether text contains any keyword (substring match); a tuple needs all its parts."""
+    for keyword in keywords:
+        if isinstance(keyword, str):
+            if keyword in text:
+                return True
+        elif all(part in text for part in keyword):
+            return True
+    return False
+
+
+# Mock extractor heuristics: (field, ((keywords, value, confidence), ...)), rules in
+# priority order
+_MOCK_KEYWORD_RULES = (
+    ('incident_type', (
+        (('misroute', 'wrong destination', 'sent to wrong'), 'misroute', 0.8),
+        (('delay', 'late', 'missed deadline', 'sla'), 'delay', 0.8),
+        (('lost', 'missing', 'cannot locate'), 'loss', 0.8),
+        (('data error', 'incorrect data', 'wrong information', 'corrupted'), 'data_error', 0.8),
+        ((('price', 'cost'), 'negotiated price', 'below cost', 'lower than cost'), 'pricing_error', 0.75),
+        (('prediction', 'forecast', 'misclassif', 'model'), 'prediction_failure', 0.7),
+        (('outage', 'down', 'unavailable', 'offline'), 'system_outage', 0.8),
+    )),
+    ('asset_type', (
+        (('shipment', 'consignment'), 'shipment', 0.8),
+        (('package', 'parcel'), 'package', 0.8),
+        (('container',), 'container', 0.8),
+        (('model', 'algorithm', 'ai', 'ml'), 'ai_model', 0.7),
+        (('sensor', 'tracker', 'iot'), 'sensor', 0.8),
+        (('route', 'path'), 'route', 0.7),
+        (('prediction', 'forecast', 'eta'), 'prediction', 0.7),
+        (('document', 'manifest', 'record'), 'document', 0.8),
+    )),
+    ('impact_severity', (
+        (('critical', 'urgent', 'emergency'), 'critical', 0.8),
+        (('severe', 'major', 'significant'), 'severe', 0.7),
+        (('moderate', 'medium'), 'moderate', 0.7),
+        (('minor', 'small', 'slight'), 'minor', 0.7),
+    )),
+)
+
+_COMPONENT_PATTERNS = tuple(
+    (re.compile(pattern), component)
+    for pattern, component in (
+        (r'routing[- ]?engine', 'routing-engine'),
+        (r'prediction[- ]?service', 'prediction-service'),
+        (r'tracking[- ]?system', 'tracking-system'),
+        (r'sorting[- ]?system', 'sorting-system'),
+        (r'api[- ]?gateway', 'api-gateway'),
+        (r'data[- ]?pipeline', 'data-pipeline'),
+        (r'warehouse[- ]?management', 'warehouse-management'),
+    )
+)
+
+_LOCATION_RE = re.compile(r'\b(HUB-[A-Z]{2,4}-\d{1,3}|[A-Z]{2,4}-\d{3,6})\b', re.IGNORECASE)
+_COST_RE = re.compile(r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+
+
 class MockTextExtractor(TextExtractor):
     """Mock extractor for testing (deterministic, no API calls)."""
 
@@ -249,93 +307,30 @@ class MockTextExtractor(TextExtractor):
 
         text_lower = text.lower()
 
-        # Heuristic incident type detection
-        if 'misroute' in text_lower or 'wrong destination' in text_lower or 'sent to wrong' in text_lower:
-            extracted['incident_type'] = 'misroute'
-            extracted['incident_type_confidence'] = 0.8
-        elif 'delay' in text_lower or 'late' in text_lower or 'missed deadline' in text_lower or 'sla' in text_lower:
-            extracted['incident_type'] = 'delay'
-            extracted['incident_type_confidence'] = 0.8
-        elif 'lost' in text_lower or 'missing' in text_lower or 'cannot locate' in text_lower:
-            extracted['incident_type'] = 'loss'
-            extracted['incident_type_confidence'] = 0.8
-        elif 'data error' in text_lower or 'incorrect data' in text_lower or 'wrong information' in text_lower or 'corrupted' in text_lower:
-            extracted['incident_type'] = 'data_error'
-            extracted['incident_type_confidence'] = 0.8
-        elif ('price' in text_lower and 'cost' in text_lower) or 'negotiated price' in text_lower or 'below cost' in text_lower or 'lower than cost' in text_lower:
-            extracted['incident_type'] = 'pricing_error'
-            extracted['incident_type_confidence'] = 0.75
-        elif 'prediction' in text_lower or 'forecast' in text_lower or 'misclassif' in text_lower or 'model' in text_lower:
-            extracted['incident_type'] = 'prediction_failure'
-            extracted['incident_type_confidence'] = 0.7
-        elif 'outage' in text_lower or 'down' in text_lower or 'unavailable' in text_lower or 'offline' in text_lower:
-            extracted['incident_type'] = 'system_outage'
-            extracted['incident_type_confidence'] = 0.8
-
-        # Heuristic asset type detection
-        if 'shipment' in text_lower or 'consignment' in text_lower:
-            extracted['asset_type'] = 'shipment'
-            extracted['asset_type_confidence'] = 0.8
-        elif 'package' in text_lower or 'parcel' in text_lower:
-            extracted['asset_type'] = 'package'
-            extracted['asset_type_confidence'] = 0.8
-        elif 'container' in text_lower:
-            extracted['asset_type'] = 'container'
-            extracted['asset_type_confidence'] = 0.8
-        elif 'model' in text_lower or 'algorithm' in text_lower or 'ai' in text_lower or 'ml' in text_lower:
-            extracted['asset_type'] = 'ai_model'
-            extracted['asset_type_confidence'] = 0.7
-        elif 'sensor' in text_lower or 'tracker' in text_lower or 'iot' in text_lower:
-            extracted['asset_type'] = 'sensor'
-            extracted['asset_type_confidence'] = 0.8
-        elif 'route' in text_lower or 'path' in text_lower:
-            extracted['asset_type'] = 'route'
-            extracted['asset_type_confidence'] = 0.7
-        elif 'prediction' in text_lower or 'forecast' in text_lower or 'eta' in text_lower:
-            extracted['asset_type'] = 'prediction'
-            extracted['asset_type_confidence'] = 0.7
-        elif 'document' in text_lower or 'manifest' in text_lower or 'record' in text_lower:
-            extracted['asset_type'] = 'document'
-            extracted['asset_type_confidence'] = 0.8
-
-        # Heuristic severity detection
-        if 'critical' in text_lower or 'urgent' in text_lower or 'emergency' in text_lower:
-            extracted['impact_severity'] = 'critical'
-            extracted['impact_severity_confidence'] = 0.8
-        elif 'severe' in text_lower or 'major' in text_lower or 'significant' in text_lower:
-            extracted['impact_severity'] = 'severe'
-            extracted['impact_severity_confidence'] = 0.7
-        elif 'moderate' in text_lower or 'medium' in text_lower:
-            extracted['impact_severity'] = 'moderate'
-            extracted['impact_severity_confidence'] = 0.7
-        elif 'minor' in text_lower or 'small' in text_lower or 'slight' in text_lower:
-            extracted['impact_severity'] = 'minor'
-            extracted['impact_severity_confidence'] = 0.7
+        # Heuristic keyword classification: first matching rule per field wins
+        for field, rules in _MOCK_KEYWORD_RULES:
+            for keywords, value, confidence in rules:
+                if _mentions(text_lower, keywords):
+                    extracted[field] = value
+                    extracted[f'{field}_confidence'] = confidence
+                    break
 
         # System component detection (look for common patterns)
-        component_patterns = [
-            (r'routing[- ]?engine', 'routing-engine'),
-            (r'prediction[- ]?service', 'prediction-service'),
-            (r'tracking[- ]?system', 'tracking-system'),
-            (r'sorting[- ]?system', 'sorting-system'),
-            (r'api[- ]?gateway', 'api-gateway'),
-            (r'data[- ]?pipeline', 'data-pipeline'),
-            (r'warehouse[- ]?management', 'warehouse-management'),
-        ]
-        for pattern, component in component_patterns:
-            if re.search(pattern, text_lower):
+        for pattern, component in _COMPONENT_PATTERNS:
+            if pattern.search(text_lower):
                 extracted['system_component'] = component
                 extracted['system_component_confidence'] = 0.8
                 break
 
-        # Location detection (hub IDs, facility codes)
-        location_match = re.search(r'\b(HUB-[A-Z]{2,4}-\d{1,3}|[A-Z]{2,4}-\d{3,6})\b', text, re.IGNORECASE)
+        # Location detection (hub IDs, facility codes); every ID contains a '-', so
+        # skip the regex scan on text without one
+        location_match = _LOCATION_RE.search(text) if '-' in text else None
         if location_match:
             extracted['incident_location'] = location_match.group(1).upper()
             extracted['incident_location_confidence'] = 0.85
 
         # Try to extract cost (only if explicitly stated with currency)
-        cost_match = re.search(r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', text)
+        cost_match = _COST_RE.search(text)
         if cost_match:
             cost_str = cost_match.group(1).replace(',', '')
             try:
@@ -9,12 +9,13 @@ Handles post-call/chat claim processing:
 This runs AFTER the voice call or chat session completes.
 """
 
-import json
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional, TYPE_CHECKING
 
+import orjson
 from openai import AsyncOpenAI
 
 from ..fnol.checker import check_claim, CheckReport
@@ -287,18 +288,10 @@ def validate_claim(claim_data: dict) -> tuple[bool, list[str], list[str]]:
     return is_complete, missing, errors
 
 
-async def analyze_fraud(claim_data: dict) -> tuple[float, list[str]]:
-    """
-    Analyze property damage claim for fraud indicators using LLM.
-    
-    Returns:
-        Tuple of (fraud_score, fraud_indicators)
-    """
-    try:
-        client = AsyncOpenAI()
-        
-        # Build analysis prompt
-        system_prompt = """You are a fraud detection analyst for an insurance company.
+# Static fraud-analysis instructions. Kept at module level and ahead of the
+# per-claim details so every request shares an identical, cacheable prefix;
+# bump _FRAUD_PROMPT_CACHE_KEY when editing it.
+_FRAUD_SYSTEM_PROMPT = """You are a fraud detection analyst for an insurance company.
 Analyze the property damage claim data and identify potential fraud indicators.
 
 Consider:
@@ -316,6 +309,24 @@ Respond with JSON only:
 }
 
 Be objective. Most claims are legitimate. Only flag genuine concerns."""
+_FRAUD_PROMPT_CACHE_KEY = "claim_fraud_analysis_v1"
+
+
+async def analyze_fraud(
+    claim_data: dict, client: Optional[AsyncOpenAI] = None
+) -> tuple[float, list[str]]:
+    """
+    Analyze property damage claim for fraud indicators using LLM.
+    
+    Args:
+        claim_data: The claim data to analyze
+        client: OpenAI client to reuse (a new one is created if None)
+    
+    Returns:
+        Tuple of (fraud_score, fraud_indicators)
+    """
+    try:
+        client = client or AsyncOpenAI()
 
         damage_type = _get_nested(claim_data, 'incident.damage_type', 'unknown')
         description = _get_nested(claim_data, 'incident.incident_description', 'not provided')
@@ -346,15 +357,17 @@ Has Repair Estimate: {has_estimate}
         response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _FRAUD_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt},
             ],
             response_format={"type": "json_object"},
             temperature=0,
             max_tokens=500,
+            # Route every request to the same prompt-cache shard for the shared prefix
+            extra_body={"prompt_cache_key": _FRAUD_PROMPT_CACHE_KEY},
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = orjson.loads(response.choices[0].message.content)
         
         return result.get("fraud_score", 0.0), result.get("indicators", [])
         
@@ -500,6 +513,20 @@ class ClaimProcessor:
     Supports operational liability claims (AI logistics) and legacy property damage claims.
     """
 
+    def __init__(self):
+        # Reused across fraud checks for its connection pool; the pool is bound
+        # to the event loop that first used it, so it is rebuilt on a new loop
+        self._openai_client: Optional[AsyncOpenAI] = None
+        self._openai_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_openai_client(self) -> AsyncOpenAI:
+        """Get the OpenAI client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._openai_client is None or self._openai_client_loop is not loop:
+            self._openai_client = AsyncOpenAI()
+            self._openai_client_loop = loop
+        return self._openai_client
+
     async def process_claim(self, claim_data: dict, call_sid: str = "") -> ClaimProcessingResult:
         """
         Process a claim through the full workflow.
@@ -520,7 +547,7 @@ class ClaimProcessor:
         # Step 2: Fraud analysis (skip if too incomplete)
         if len(result.missing_fields) <= 3:
             logger.info(f"Analyzing fraud risk for claim {call_sid}")
-            result.fraud_score, result.fraud_indicators = await analyze_fraud(claim_data)
+            result.fraud_score, result.fraud_indicators = await analyze_fraud(claim_data, self._get_openai_client())
         else:
             logger.info("Skipping fraud analysis - claim too incomplete")
             result.fraud_score = 0.0
@@ -8,7 +8,9 @@ Provides SQLite-based storage for:
 """
 
 from .claim_store import (
+    ClaimStats,
     ClaimStore,
+    ClaimSummary,
     StoredClaim,
     get_claim_store,
     save_claim,
@@ -18,7 +20,9 @@ from .claim_store import (
     )
 
 __all__ = [
+    "ClaimStats",
     "ClaimStore",
+    "ClaimSummary",
     "StoredClaim",
     "get_claim_store",
     "save_claim",
@@ -7,13 +7,16 @@ No external database setup required - just works.
 
 import json
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
-from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 from dataclasses import dataclass
 
+import orjson
+
 # Database file location
 DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "claims.db"
 
@@ -50,6 +53,24 @@ class StoredClaim:
     operational_impact: Optional[dict] = None  # AI logistics claims
 
 
+@dataclass
+class ClaimStats:
+    """Claim counts for the whole store."""
+    total: int
+    by_status: dict
+    by_source: dict
+    db_path: str
+
+
+class ClaimSummary(NamedTuple):
+    """The columns a claim listing shows, without decoding the JSON sections."""
+    claim_id: str
+    status: str
+    source: str
+    created_at: str
+    claimant_name: Optional[str]
+
+
 class ClaimStore:
     """
     SQLite-based storage for insurance claims.
@@ -74,7 +95,11 @@ class ClaimStore:
         """Initialize the claim store."""
         self.db_path = db_path or DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One reused connection per thread (sqlite3 connections are thread-bound)
+        self._local = threading.local()
         self._init_db()
+        # (monotonic time computed, stats) for summary()
+        self._stats_cache: Optional[tuple[float, ClaimStats]] = None
     
     def _init_db(self):
         """Create tables if they don't exist."""
@@ -115,6 +140,10 @@ class ClaimStore:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_claims_status ON claims(status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_claims_created ON claims(created_at)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_claims_source ON claims(source)")
+            # Status/source histogram (covering), and filtered listings in created_at order
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_claims_status_source ON claims(status, source)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_claims_status_created ON claims(status, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_claims_source_created ON claims(source, created_at)")
             
             # Add new columns if they don't exist (for existing databases)
             try:
@@ -166,12 +195,30 @@ class ClaimStore:
     
     @contextmanager
     def _get_connection(self):
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's database connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
         try:
             yield conn
-        finally:
+        except Exception:
+            # Don't leave a half-done write open on the reused connection
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+    
+    def close(self) -> None:
+        """
+        Close the calling thread's connection.
+        
+        Connections opened by other threads are closed when those threads
+        exit; the next call from this thread opens a fresh connection.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
             conn.close()
     
     def _generate_claim_id(self) -> str:
@@ -238,6 +285,7 @@ class ClaimStore:
                 json.dumps(operational_impact) if operational_impact is not None else None,
             ))
             conn.commit()
+            self._stats_cache = None
         
         return claim_id
     
@@ -310,6 +358,59 @@ class ClaimStore:
             rows = conn.execute(query, params).fetchall()
             return [self._row_to_stored_claim(row) for row in rows]
     
+    def list_summaries(
+        self,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[ClaimSummary]:
+        """
+        List claim summaries with optional filtering (newest first).
+        
+        Like list_all, but only reads the listing columns; the claimant
+        name is extracted in SQL.
+        
+        Returns:
+            List of ClaimSummary tuples
+        """
+        return list(self.iter_summaries(status=status, source=source, limit=limit, offset=offset))
+    
+    def iter_summaries(
+        self,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Iterator[ClaimSummary]:
+        """
+        Yield claim summaries row by row from the cursor (newest first).
+        
+        Same filters as list_summaries, without materializing the result
+        set; the cursor stays open until the generator is exhausted or
+        closed.
+        """
+        query = (
+            "SELECT claim_id, status, source, created_at, "
+            "json_extract(claimant, '$.name') FROM claims WHERE 1=1"
+        )
+        params = []
+        
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        
+        with self._get_connection() as conn:
+            for row in conn.execute(query, params):
+                yield ClaimSummary(*row)
+    
     def update_status(self, claim_id: str, status: str, notes: Optional[str] = None) -> bool:
         """
         Update claim status.
@@ -336,6 +437,7 @@ class ClaimStore:
                     (status, now, claim_id)
                 )
             conn.commit()
+            self._stats_cache = None
             return result.rowcount > 0
     
     def save_processing_result(
@@ -430,6 +532,7 @@ class ClaimStore:
                 (claim_id,)
             )
             conn.commit()
+            self._stats_cache = None
             return result.rowcount > 0
     
     def count(self, status: Optional[str] = None) -> int:
@@ -444,6 +547,50 @@ class ClaimStore:
                 row = conn.execute("SELECT COUNT(*) FROM claims").fetchone()
             return row[0]
     
+    def status_source_histogram(self) -> list[tuple[str, str, int]]:
+        """Count claims per (status, source) pair in one query."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT status, source, COUNT(*) FROM claims GROUP BY status, source"
+            ).fetchall()
+            return [tuple(row) for row in rows]
+    
+    def summary(self, max_age: float = 5.0) -> ClaimStats:
+        """
+        Claim counts by status and source, from one GROUP BY query.
+        
+        Args:
+            max_age: Reuse the last result if it is at most this many seconds old
+                (0 always queries); other processes' writes show up after it expires
+        
+        Returns:
+            ClaimStats (a fresh copy; callers may modify it)
+        """
+        now = time.monotonic()
+        if self._stats_cache is None or now - self._stats_cache[0] > max_age:
+            self._stats_cache = (now, self._compute_stats())
+        stats = self._stats_cache[1]
+        return ClaimStats(
+            total=stats.total,
+            by_status=dict(stats.by_status),
+            by_source=dict(stats.by_source),
+            db_path=stats.db_path,
+        )
+    
+    def _compute_stats(self) -> ClaimStats:
+        """Aggregate status_source_histogram() into ClaimStats."""
+        by_status: dict[str, int] = {}
+        by_source: dict[str, int] = {}
+        for status, source, count in self.status_source_histogram():
+            by_status[status] = by_status.get(status, 0) + count
+            by_source[source] = by_source.get(source, 0) + count
+        return ClaimStats(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            by_source=by_source,
+            db_path=str(self.db_path),
+        )
+    
     def _row_to_stored_claim(self, row: sqlite3.Row) -> StoredClaim:
         """Convert a database row to StoredClaim."""
         # Handle optional new columns that may not exist in older databases
@@ -453,25 +600,25 @@ class ClaimStore:
         
         try:
             if row["transcript"]:
-                transcript = json.loads(row["transcript"])
+                transcript = orjson.loads(row["transcript"])
         except (KeyError, IndexError):
             pass
         
         try:
             if row["consistency"]:
-                consistency = json.loads(row["consistency"])
+                consistency = orjson.loads(row["consistency"])
         except (KeyError, IndexError):
             pass
         
         try:
             if row["call_metadata"]:
-                call_metadata = json.loads(row["call_metadata"])
+                call_metadata = orjson.loads(row["call_metadata"])
         except (KeyError, IndexError):
             pass
         operational_impact = None
         try:
             if row["operational_impact"]:
-                operational_impact = json.loads(row["operational_impact"])
+                operational_impact = orjson.loads(row["operational_impact"])
         except (KeyError, IndexError, TypeError):
             pass
 
@@ -481,13 +628,13 @@ class ClaimStore:
             updated_at=row["updated_at"],
             status=row["status"],
             source=row["source"],
-            claimant=json.loads(row["claimant"]),
-            incident=json.loads(row["incident"]),
-            property_damage=json.loads(row["property_damage"]),
-            evidence=json.loads(row["evidence"]),
-            validation_result=json.loads(row["validation_result"]) if row["validation_result"] else None,
-            fraud_result=json.loads(row["fraud_result"]) if row["fraud_result"] else None,
-            routing_result=json.loads(row["routing_result"]) if row["routing_result"] else None,
+            claimant=orjson.loads(row["claimant"]),
+            incident=orjson.loads(row["incident"]),
+            property_damage=orjson.loads(row["property_damage"]),
+            evidence=orjson.loads(row["evidence"]),
+            validation_result=orjson.loads(row["validation_result"]) if row["validation_result"] else None,
+            fraud_result=orjson.loads(row["fraud_result"]) if row["fraud_result"] else None,
+            routing_result=orjson.loads(row["routing_result"]) if row["routing_result"] else None,
             call_sid=row["call_sid"],
             session_id=row["session_id"],
             notes=row["notes"],
@@ -502,10 +649,18 @@ class ClaimStore:
 # Convenience Functions
 # =============================================================================
 
-@lru_cache
+_default_store: Optional[ClaimStore] = None
+_default_store_lock = threading.Lock()
+
+
 def get_claim_store() -> ClaimStore:
     """Get the default claim store (singleton)."""
-    return ClaimStore()
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = ClaimStore()
+    return _default_store
 
 
 def save_claim(claim_data: dict, source: str = "unknown", **kwargs) -> str:
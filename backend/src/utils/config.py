@@ -82,6 +82,22 @@ class Settings(BaseSettings):
         default=600,
         description="Silence duration before VAD triggers end of speech (ms). 600ms is balanced.",
     )
+    realtime_ws_backend: str = Field(
+        default="websockets",
+        description="WebSocket client for the OpenAI Realtime API: 'websockets' or 'picows' (lower per-frame overhead, requires the picows package)",
+    )
+    realtime_send_batch: int = Field(
+        default=3,
+        description="Max queued caller audio chunks (20ms each) merged into one Realtime append. 1 disables merging.",
+    )
+    realtime_outbound_max: int = Field(
+        default=50,
+        description="Max caller audio chunks (20ms each) queued for the Realtime API; the oldest is dropped when full.",
+    )
+    realtime_audio_fast_path: bool = Field(
+        default=True,
+        description="Recognise Realtime audio delta frames by prefix and skip JSON parsing for them. Disable to always parse.",
+    )
     # Note: welcome_message is no longer used - the AI agent handles the greeting naturally
     welcome_message: str = Field(
         default="",
@@ -12,7 +12,7 @@ This module handles:
 import asyncio
 import json
 import logging
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from fastapi import WebSocket  # type: ignore[import-untyped]
 
@@ -20,7 +20,7 @@ from ..fnol.extractor import OperationalClaimExtractor
 from ..fnol.state_manager import OperationalClaimStateManager
 from ..fnol.checker import check_claim, CheckReport
 from ..policy import get_policy_service
-from .openai_realtime import OpenAIRealtimeClient
+from .openai_realtime import OpenAIRealtimeClient, RealtimeEvent, RealtimeEventType
 from .prompts import get_voice_agent_prompt, CLAIM_COMPLETE_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -30,6 +30,43 @@ logger = logging.getLogger(__name__)
 # Higher threshold ensures more complete information before ending
 COMPLETENESS_THRESHOLD = 0.75
 
+# Warn each time this many more agent audio deltas have been received than
+# forwarded to Twilio (audio is being lost, e.g. no stream yet or send failures)
+AUDIO_GAP_WARNING_THRESHOLD = 25
+
+# Hot-path event type, compared inline before the dispatch table lookup
+AUDIO_DELTA_EVENT = RealtimeEventType.RESPONSE_AUDIO_DELTA.value
+
+# Twilio media frames are compact JSON with "event" as the first key; the
+# base64 payload can be sliced out without a json.loads per 20ms frame.
+_TWILIO_MEDIA_MARKER = '"event":"media"'
+_TWILIO_MEDIA_PEEK_LEN = 32
+_TWILIO_PAYLOAD_KEY = '"payload":"'
+
+
+def _scan_twilio_media_payload(message: str) -> Optional[str]:
+    """
+    Extract the base64 audio payload of a Twilio media frame without JSON parsing.
+
+    Args:
+        message: Raw text frame received from Twilio Media Streams
+
+    Returns:
+        The base64 payload, or None if the frame is not a media frame (or does
+        not have the expected shape, in which case callers fall back to json.loads).
+    """
+    if message.find(_TWILIO_MEDIA_MARKER, 0, _TWILIO_MEDIA_PEEK_LEN) < 0:
+        return None
+    start = message.find(_TWILIO_PAYLOAD_KEY)
+    if start < 0:
+        return None
+    start += len(_TWILIO_PAYLOAD_KEY)
+    # Base64 never contains quotes or escapes, so the next quote ends the value
+    end = message.find('"', start)
+    if end < 0:
+        return None
+    return message[start:end]
+
 
 class AudioBridge:
     """
@@ -69,6 +106,10 @@ class AudioBridge:
         # State tracking
         self._twilio_ws: Optional[WebSocket] = None
         self._is_agent_speaking = False
+        self._audio_deltas_forwarded = 0
+        self._media_frame_sid: Optional[str] = None
+        self._media_frame_prefix = ""
+        self._audio_gap_reported = 0
         self._pending_transcripts: list[str] = []
         self._extraction_task: Optional[asyncio.Task] = None
         self._shutdown_event: Optional[asyncio.Event] = None
@@ -76,6 +117,8 @@ class AudioBridge:
         # Completeness tracking
         self._last_check_report: Optional[CheckReport] = None
         self._claim_complete_notified = False
+        # Last instructions sent to OpenAI (skip re-sending an identical prompt)
+        self._last_instructions: Optional[str] = None
         
         # Call ending - track goodbye from both parties
         self._should_end_call = False
@@ -91,6 +134,21 @@ class AudioBridge:
         self.openai_client.on_speech_started(self._handle_speech_started)
         self.openai_client.on_transcript(self._handle_transcript)
         self.openai_client.on_error(self._handle_error)
+        
+        # Dispatch table for _openai_to_twilio, keyed on the raw event type.
+        # Handlers return True when the stream should stop.
+        self._event_dispatch: dict[str, Callable[[RealtimeEvent], Awaitable[bool]]] = {
+            RealtimeEventType.SESSION_CREATED.value: self._on_session_created,
+            RealtimeEventType.SESSION_UPDATED.value: self._on_session_updated,
+            RealtimeEventType.RESPONSE_AUDIO_DONE.value: self._on_audio_done,
+            RealtimeEventType.RESPONSE_DONE.value: self._on_response_done,
+            RealtimeEventType.RESPONSE_AUDIO_TRANSCRIPT_DONE.value: self._on_agent_transcript_done,
+            RealtimeEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED.value: self._on_speech_started,
+            RealtimeEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED.value: (
+                self._on_user_transcript_done
+            ),
+            RealtimeEventType.ERROR.value: self._on_error_event,
+        }
     
     async def run(self, twilio_ws: WebSocket) -> None:
         """
@@ -104,45 +162,42 @@ class AudioBridge:
         
         try:
             async with self.openai_client.connect():
-                logger.info(f"Audio bridge started for call {self.call_sid}")
+                logger.info("Audio bridge started for call %s", self.call_sid)
                 
                 # Send initial greeting to start the conversation
                 await self._send_initial_greeting()
                 
-                # Run both directions concurrently
-                tasks = [
-                    asyncio.create_task(self._twilio_to_openai()),
-                    asyncio.create_task(self._openai_to_twilio()),
-                ]
-                
-                # Wait for either task to complete (usually Twilio "stop" event)
-                done, pending = await asyncio.wait(
-                    tasks, return_when=asyncio.FIRST_COMPLETED
-                )
-                
-                # Cancel pending tasks when one completes
-                for task in pending:
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-                
-                # Check for exceptions in completed tasks
-                for task in done:
-                    if task.exception():
-                        logger.error(f"Task error: {task.exception()}")
+                # Run both directions concurrently; whichever finishes first
+                # (usually the Twilio "stop" event) cancels the other
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        twilio_task = tg.create_task(self._twilio_to_openai())
+                        openai_task = tg.create_task(self._openai_to_twilio())
+                        twilio_task.add_done_callback(lambda _: openai_task.cancel())
+                        openai_task.add_done_callback(lambda _: twilio_task.cancel())
+                except* Exception as eg:
+                    # Log task failures without failing the bridge
+                    for exc in eg.exceptions:
+                        logger.error("Task error: %s", exc)
                 
         except Exception as e:
-            logger.error(f"Audio bridge error: {e}")
+            logger.error("Audio bridge error: %s", e)
             raise
         finally:
             # Finalize the FNOL state
             final_state = self.fnol_state.finalize()
             logger.info(
-                f"Call ended. FNOL completion: {self.fnol_state.get_completion_percentage():.0f}%"
+                "Call ended. FNOL completion: %.0f%%", self.fnol_state.get_completion_percentage()
             )
-            logger.debug(f"Final FNOL state: {json.dumps(final_state, indent=2)}")
+            audio_gap = self.openai_client.audio_deltas_received - self._audio_deltas_forwarded
+            if audio_gap > 0:
+                logger.warning(
+                    "%d of %d agent audio deltas were not forwarded to Twilio",
+                    audio_gap,
+                    self.openai_client.audio_deltas_received,
+                )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Final FNOL state: %s", json.dumps(final_state, indent=2))
     
     async def _send_initial_greeting(self) -> None:
         """Send initial greeting to start the conversation."""
@@ -154,7 +209,7 @@ class AudioBridge:
             await self.openai_client.create_response()
             logger.info("Initial greeting requested from OpenAI")
         except Exception as e:
-            logger.error(f"Failed to send initial greeting: {e}")
+            logger.error("Failed to send initial greeting: %s", e)
     
     async def _twilio_to_openai(self) -> None:
         """Forward audio from Twilio to OpenAI."""
@@ -163,8 +218,14 @@ class AudioBridge:
                 try:
                     message = await self._twilio_ws.receive_text()
                 except Exception as e:
-                    logger.info(f"Twilio WebSocket closed: {e}")
+                    logger.info("Twilio WebSocket closed: %s", e)
                     break
+                
+                # Fast path: forward caller audio without parsing the frame
+                payload = _scan_twilio_media_payload(message)
+                if payload:
+                    await self.openai_client.send_audio(payload)
+                    continue
                     
                 data = json.loads(message)
                 event = data.get("event")
@@ -179,7 +240,7 @@ class AudioBridge:
                     self.claim_state.call_sid = self.call_sid
                     self.claim_state.stream_sid = self.stream_sid
                     
-                    logger.info(f"Twilio stream started: {self.stream_sid}")
+                    logger.info("Twilio stream started: %s", self.stream_sid)
                     
                     # Notify that call has started (for registration in active_calls)
                     if self._on_call_started and self.call_sid:
@@ -203,140 +264,193 @@ class AudioBridge:
                     
                 elif event == "mark":
                     # Playback mark reached
-                    logger.debug(f"Playback mark: {data.get('mark', {}).get('name')}")
+                    logger.debug("Playback mark: %s", data.get("mark", {}).get("name"))
                     
         except asyncio.CancelledError:
             logger.info("Twilio->OpenAI stream cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error in Twilio->OpenAI stream: {e}")
+            logger.error("Error in Twilio->OpenAI stream: %s", e)
     
     async def _openai_to_twilio(self) -> None:
         """Forward audio from OpenAI to Twilio."""
+        dispatch = self._event_dispatch
         try:
             async for event in self.openai_client.receive_events():
-                # Handle session events (for debugging)
-                if event.type == "session.created":
-                    logger.info("OpenAI Realtime session created")
-                elif event.type == "session.updated":
-                    logger.info("OpenAI Realtime session configured")
-                
-                # Handle audio output
-                elif event.is_audio_delta and event.audio_delta:
-                    self._is_agent_speaking = True
-                    await self._send_audio_to_twilio(event.audio_delta)
-                
-                # Handle response completion
-                elif event.type == "response.audio.done":
-                    self._is_agent_speaking = False
-                    # Process any pending transcripts now that agent is done speaking
-                    await self._process_pending_transcripts()
+                event_type = event.type
                 
-                # Handle response done
-                elif event.type == "response.done":
-                    logger.debug("OpenAI response completed")
-                    # Check if both parties have said goodbye
-                    if self._should_end_call and self._agent_said_goodbye and self._user_said_goodbye:
-                        logger.info("Both parties said goodbye - ending call now")
-                        await asyncio.sleep(1.0)  # Brief pause after mutual goodbye
-                        await self._end_twilio_call()
-                        break
-                    elif self._should_end_call and self._agent_said_goodbye:
-                        # Agent said goodbye, wait a bit for user's response
-                        logger.info("Agent said goodbye, waiting for user response...")
-                        # Don't break - wait for user's goodbye
+                # Handle audio output inline - audio deltas dominate the stream
+                if event_type == AUDIO_DELTA_EVENT:
+                    audio_delta = event.data.get("delta")
+                    if audio_delta:
+                        self._is_agent_speaking = True
+                        if await self._send_audio_to_twilio(audio_delta):
+                            self._audio_deltas_forwarded += 1
+                        else:
+                            self._check_audio_gap()
+                    continue
                 
-                # Handle AI's response transcript (to detect goodbye and END_CALL)
-                elif event.type == "response.audio_transcript.done":
-                    transcript = event.data.get("transcript", "")
-                    if transcript:
-                        # Add to conversation record
-                        self.fnol_state.add_transcript_entry("assistant", transcript)
-                        logger.debug(f"Agent said: {transcript[:100]}...")
-                        
-                        transcript_lower = transcript.lower()
-                        
-                        # Check for END_CALL signal (case insensitive, anywhere in text)
-                        if "END_CALL" in transcript.upper() or "END CALL" in transcript.upper():
-                            logger.info("Agent sent END_CALL signal")
-                            self._should_end_call = True
-                        
-                        # Check if agent said goodbye
-                        goodbye_phrases = ["bye", "goodbye", "take care", "have a good", "talk soon"]
-                        if any(phrase in transcript_lower for phrase in goodbye_phrases):
-                            logger.info("Agent said goodbye")
-                            self._agent_said_goodbye = True
-                            # If user already said goodbye, we can end
-                            if self._user_said_goodbye:
-                                self._should_end_call = True
-                            else:
-                                # Start a timeout - if user doesn't respond in 5 seconds, end anyway
-                                if self._goodbye_timeout_task is None:
-                                    self._goodbye_timeout_task = asyncio.create_task(
-                                        self._goodbye_timeout()
-                                    )
-                
-                # Handle speech started (barge-in)
-                elif event.is_speech_started:
-                    if self._is_agent_speaking:
-                        logger.info("🛑 User interrupted - stopping agent speech")
-                        # User interrupted - clear Twilio playback immediately
-                        await self._clear_twilio_playback()
-                        # Cancel OpenAI response
-                        await self.openai_client.cancel_response()
-                        self._is_agent_speaking = False
-                        # Note: The AI will naturally respond to the interruption
-                        # because the prompt instructs it to say "Oh, go ahead" etc.
-                
-                # Handle transcript completion
-                elif event.is_transcript_complete and event.transcript:
-                    # Queue transcript for processing
-                    self._pending_transcripts.append(event.transcript)
-                    # Add to conversation record
-                    self.fnol_state.add_transcript_entry("user", event.transcript)
-                    
-                    # Check if user said goodbye
-                    user_text_lower = event.transcript.lower()
-                    goodbye_phrases = ["bye", "goodbye", "take care", "thank you", "thanks"]
-                    if any(phrase in user_text_lower for phrase in goodbye_phrases):
-                        logger.info(f"User said goodbye: '{event.transcript}'")
-                        self._user_said_goodbye = True
-                        # If agent already said goodbye, we can end
-                        if self._agent_said_goodbye:
-                            self._should_end_call = True
-                            logger.info("Both parties have said goodbye - will end call after next response")
-                    
-                    # If agent isn't speaking, process immediately
-                    if not self._is_agent_speaking:
-                        await self._process_pending_transcripts()
-                
-                # Handle errors
-                elif event.is_error:
-                    logger.error(f"OpenAI error: {event.error_message}")
+                handler = dispatch.get(event_type)
+                if handler is not None and await handler(event):
+                    break
                     
         except asyncio.CancelledError:
             logger.info("OpenAI->Twilio stream cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error in OpenAI->Twilio stream: {e}")
+            logger.error("Error in OpenAI->Twilio stream: %s", e)
     
-    async def _send_audio_to_twilio(self, audio_b64: str) -> None:
-        """Send audio data to Twilio."""
-        if not self._twilio_ws or not self.stream_sid:
-            return
+    async def _on_session_created(self, event: RealtimeEvent) -> bool:
+        """Handle session creation (for debugging)."""
+        logger.info("OpenAI Realtime session created")
+        return False
+    
+    async def _on_session_updated(self, event: RealtimeEvent) -> bool:
+        """Handle session configuration (for debugging)."""
+        logger.info("OpenAI Realtime session configured")
+        return False
+    
+    async def _on_audio_done(self, event: RealtimeEvent) -> bool:
+        """Handle response audio completion."""
+        self._is_agent_speaking = False
+        # Process any pending transcripts now that agent is done speaking
+        await self._process_pending_transcripts()
+        return False
+    
+    async def _on_response_done(self, event: RealtimeEvent) -> bool:
+        """
+        Handle response completion.
         
-        message = {
-            "event": "media",
-            "streamSid": self.stream_sid,
-            "media": {
-                "payload": audio_b64,
-            },
-        }
+        Returns:
+            True if the call has ended and the stream should stop
+        """
+        logger.debug("OpenAI response completed")
+        # Check if both parties have said goodbye
+        if self._should_end_call and self._agent_said_goodbye and self._user_said_goodbye:
+            logger.info("Both parties said goodbye - ending call now")
+            await asyncio.sleep(1.0)  # Brief pause after mutual goodbye
+            await self._end_twilio_call()
+            return True
+        elif self._should_end_call and self._agent_said_goodbye:
+            # Agent said goodbye, wait a bit for user's response
+            logger.info("Agent said goodbye, waiting for user response...")
+            # Don't stop - wait for user's goodbye
+        return False
+    
+    async def _on_agent_transcript_done(self, event: RealtimeEvent) -> bool:
+        """Handle AI's response transcript (to detect goodbye and END_CALL)."""
+        transcript = event.data.get("transcript", "")
+        if not transcript:
+            return False
+        
+        # Add to conversation record
+        self.fnol_state.add_transcript_entry("assistant", transcript)
+        logger.debug("Agent said: %.100s...", transcript)
+        
+        transcript_lower = transcript.lower()
+        
+        # Check for END_CALL signal (case insensitive, anywhere in text)
+        if "END_CALL" in transcript.upper() or "END CALL" in transcript.upper():
+            logger.info("Agent sent END_CALL signal")
+            self._should_end_call = True
+        
+        # Check if agent said goodbye
+        goodbye_phrases = ["bye", "goodbye", "take care", "have a good", "talk soon"]
+        if any(phrase in transcript_lower for phrase in goodbye_phrases):
+            logger.info("Agent said goodbye")
+            self._agent_said_goodbye = True
+            # If user already said goodbye, we can end
+            if self._user_said_goodbye:
+                self._should_end_call = True
+            else:
+                # Start a timeout - if user doesn't respond in 5 seconds, end anyway
+                if self._goodbye_timeout_task is None:
+                    self._goodbye_timeout_task = asyncio.create_task(
+                        self._goodbye_timeout()
+                    )
+        return False
+    
+    async def _on_speech_started(self, event: RealtimeEvent) -> bool:
+        """Handle speech started (barge-in)."""
+        if self._is_agent_speaking:
+            logger.info("🛑 User interrupted - stopping agent speech")
+            # User interrupted - clear Twilio playback immediately
+            await self._clear_twilio_playback()
+            # Cancel OpenAI response
+            await self.openai_client.cancel_response()
+            self._is_agent_speaking = False
+            # Note: The AI will naturally respond to the interruption
+            # because the prompt instructs it to say "Oh, go ahead" etc.
+        return False
+    
+    async def _on_user_transcript_done(self, event: RealtimeEvent) -> bool:
+        """Handle user transcript completion."""
+        transcript = event.transcript
+        if not transcript:
+            return False
+        
+        # Queue transcript for processing
+        self._pending_transcripts.append(transcript)
+        # Add to conversation record
+        self.fnol_state.add_transcript_entry("user", transcript)
+        
+        # Check if user said goodbye
+        user_text_lower = transcript.lower()
+        goodbye_phrases = ["bye", "goodbye", "take care", "thank you", "thanks"]
+        if any(phrase in user_text_lower for phrase in goodbye_phrases):
+            logger.info("User said goodbye: '%s'", transcript)
+            self._user_said_goodbye = True
+            # If agent already said goodbye, we can end
+            if self._agent_said_goodbye:
+                self._should_end_call = True
+                logger.info("Both parties have said goodbye - will end call after next response")
+        
+        # If agent isn't speaking, process immediately
+        if not self._is_agent_speaking:
+            await self._process_pending_transcripts()
+        return False
+    
+    async def _on_error_event(self, event: RealtimeEvent) -> bool:
+        """Handle OpenAI error events."""
+        logger.error("OpenAI error: %s", event.error_message)
+        return False
+    
+    def _check_audio_gap(self) -> None:
+        """Warn when agent audio received from OpenAI is not reaching Twilio."""
+        received = self.openai_client.audio_deltas_received
+        gap = received - self._audio_deltas_forwarded
+        if gap - self._audio_gap_reported >= AUDIO_GAP_WARNING_THRESHOLD:
+            self._audio_gap_reported = gap
+            logger.warning(
+                "Agent audio loss: %d of %d audio deltas not forwarded to Twilio",
+                gap,
+                received,
+            )
+    
+    async def _send_audio_to_twilio(self, audio_b64: str) -> bool:
+        """
+        Send audio data to Twilio.
+        
+        Returns:
+            True if the audio was sent, False if it was dropped
+        """
+        stream_sid = self.stream_sid
+        if not self._twilio_ws or not stream_sid:
+            return False
+        
+        # Pre-framed media message: only the (ASCII base64) payload varies per delta
+        if self._media_frame_sid != stream_sid:
+            self._media_frame_prefix = (
+                '{"event":"media","streamSid":' + json.dumps(stream_sid) + ',"media":{"payload":"'
+            )
+            self._media_frame_sid = stream_sid
         
         try:
-            await self._twilio_ws.send_text(json.dumps(message))
+            await self._twilio_ws.send_text(self._media_frame_prefix + audio_b64 + '"}}')
         except Exception as e:
-            logger.error(f"Failed to send audio to Twilio: {e}")
+            logger.error("Failed to send audio to Twilio: %s", e)
+            return False
+        return True
     
     async def _clear_twilio_playback(self) -> None:
         """Clear Twilio's playback buffer (for barge-in)."""
@@ -352,7 +466,7 @@ class AudioBridge:
             await self._twilio_ws.send_text(json.dumps(message))
             logger.debug("Cleared Twilio playback buffer")
         except Exception as e:
-            logger.error(f"Failed to clear Twilio playback: {e}")
+            logger.error("Failed to clear Twilio playback: %s", e)
     
     async def _end_twilio_call(self) -> None:
         """End the Twilio call gracefully."""
@@ -368,7 +482,7 @@ class AudioBridge:
             await self._twilio_ws.close()
             logger.info("Twilio call ended gracefully")
         except Exception as e:
-            logger.warning(f"Error closing Twilio WebSocket: {e}")
+            logger.warning("Error closing Twilio WebSocket: %s", e)
     
     async def _goodbye_timeout(self) -> None:
         """Timeout handler - end call if user doesn't respond after agent says goodbye."""
@@ -384,14 +498,15 @@ class AudioBridge:
     
     async def _process_pending_transcripts(self) -> None:
         """Process pending transcripts for claim field extraction."""
-        if not self._pending_transcripts:
+        pending = self._pending_transcripts
+        if not pending:
             return
         
-        # Combine pending transcripts
-        combined = " ".join(self._pending_transcripts)
-        self._pending_transcripts.clear()
+        # Combine pending transcripts (single pass, then reset the buffer in place)
+        combined = pending[0] if len(pending) == 1 else " ".join(pending)
+        pending.clear()
         
-        logger.info(f"📝 Processing user transcript: {combined[:100]}...")
+        logger.info("📝 Processing user transcript: %.100s...", combined)
         
         # Extract fields from transcript
         try:
@@ -405,23 +520,30 @@ class AudioBridge:
             )
             
             if extracted:
-                logger.info(f"🔍 Extracted fields: {extracted}")
+                logger.info("🔍 Extracted fields: %s", extracted)
                 updated_fields = self.claim_state.apply_patch(extracted)
-                logger.info(f"✅ Updated claim fields: {updated_fields}")
+                if not updated_fields:
+                    # Nothing changed - skip the completeness check and prompt refresh
+                    logger.debug("Extracted fields did not change the claim state")
+                    return
+                logger.info("✅ Updated claim fields: %s", updated_fields)
                 
                 # Log current state for debugging
-                claim = self.claim_state.claim
-                logger.debug(f"Current claim state - Name: {claim.claimant.name}, Policy: {claim.claimant.policy_number}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    claim = self.claim_state.claim
+                    logger.debug(
+                        "Current claim state - Name: %s, Policy: %s",
+                        claim.claimant.name,
+                        claim.claimant.policy_number,
+                    )
                 
                 # Update the agent's instructions with new context
                 await self._update_agent_context()
             else:
                 logger.debug("No fields extracted from this transcript")
                 
-        except Exception as e:
-            logger.error(f"❌ Failed to extract claim fields: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("❌ Failed to extract claim fields")
     
     def _check_claim_completeness(self) -> CheckReport:
         """
@@ -435,9 +557,10 @@ class AudioBridge:
         self._last_check_report = report
         
         logger.info(
-            f"Claim completeness: {report.completeness_score:.0%}, "
-            f"missing: {len(report.missing_required_evidence)} items, "
-            f"contradictions: {len(report.contradictions)}"
+            "Claim completeness: %.0f%%, missing: %d items, contradictions: %d",
+            report.completeness_score * 100,
+            len(report.missing_required_evidence),
+            len(report.contradictions),
         )
         
         return report
@@ -478,7 +601,7 @@ class AudioBridge:
                 elif not svc.verify_claimant_name(policy, claim.claimant.name):
                     policy_issue = f"The name on the policy is '{policy.named_insured}'. Please confirm with the caller that they are the policyholder."
             except Exception as e:
-                logger.debug(f"Policy check skipped: {e}")
+                logger.debug("Policy check skipped: %s", e)
 
         # Also include checker's recommended questions
         recommended_questions = report.recommended_questions
@@ -496,8 +619,8 @@ class AudioBridge:
         if report.completeness_score >= COMPLETENESS_THRESHOLD and not self._claim_complete_notified:
             self._claim_complete_notified = True
             logger.info(
-                f"Claim reached sufficient completeness ({report.completeness_score:.0%}). "
-                "Switching to wrap-up mode."
+                "Claim reached sufficient completeness (%.0f%%). Switching to wrap-up mode.",
+                report.completeness_score * 100,
             )
             
             # Use the claim complete prompt
@@ -541,11 +664,18 @@ class AudioBridge:
                     new_prompt += f"\n- {contradiction}"
                 new_prompt += "\nPlease gently clarify these discrepancies with the caller."
         
+        if new_prompt == self._last_instructions:
+            logger.debug("Agent instructions unchanged - skipping update")
+            return
+        
         try:
             await self.openai_client.update_instructions(new_prompt)
-            logger.debug(f"Updated agent instructions (completeness: {report.completeness_score:.0%})")
+            self._last_instructions = new_prompt
+            logger.debug(
+                "Updated agent instructions (completeness: %.0f%%)", report.completeness_score * 100
+            )
         except Exception as e:
-            logger.warning(f"Failed to update agent instructions: {e}")
+            logger.warning("Failed to update agent instructions: %s", e)
     
     def _handle_speech_started(self) -> None:
         """Handle user speech start event."""
@@ -553,11 +683,11 @@ class AudioBridge:
     
     def _handle_transcript(self, transcript: str) -> None:
         """Handle completed transcript."""
-        logger.info(f"User said: {transcript[:100]}...")
+        logger.info("User said: %.100s...", transcript)
     
     def _handle_error(self, error: str) -> None:
         """Handle OpenAI error."""
-        logger.error(f"OpenAI Realtime error: {error}")
+        logger.error("OpenAI Realtime error: %s", error)
     
     def get_fnol_summary(self) -> str:
         """Get a summary of the collected FNOL information."""
@@ -6,19 +6,29 @@ supporting PCMU audio format for direct Twilio integration.
 """
 
 import asyncio
-import json
 import logging
+import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import AsyncIterator, Callable, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional, Union
 
+import orjson
 import websockets
-from websockets.client import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection
 
 from ..utils.config import settings
 from .prompts import VOICE_AGENT_PROMPT_COMPACT
 
+try:
+    # SIMD-accelerated base64 (optional); used when merging queued audio chunks
+    from pybase64 import b64decode as _b64decode, b64encode as _b64encode
+except ImportError:
+    from base64 import b64decode as _b64decode, b64encode as _b64encode
+
+if TYPE_CHECKING:
+    from .picows_transport import PicowsConnection
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,43 +76,152 @@ class RealtimeEventType(str, Enum):
     RATE_LIMITS_UPDATED = "rate_limits.updated"
 
 
-@dataclass
+# Plain-string event types for hot comparisons (avoids Enum attribute lookups)
+_EVENT_TYPE_MAP: dict[str, RealtimeEventType] = {e.value: e for e in RealtimeEventType}
+_AUDIO_DELTA = RealtimeEventType.RESPONSE_AUDIO_DELTA.value
+_SPEECH_STARTED = RealtimeEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED.value
+_TRANSCRIPT_COMPLETED = (
+    RealtimeEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED.value
+)
+_ERROR = RealtimeEventType.ERROR.value
+
+# Whether the event loop implementation has been checked (warn once per process)
+_loop_checked = False
+
+# Minimum seconds between "dropped audio" warnings while the send backlog is full
+DROP_WARNING_INTERVAL_S = 5.0
+
+# input_audio_buffer.append framing; only the base64 payload varies per frame
+_APPEND_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+_APPEND_SUFFIX = b'"}'
+
+def _build_session_update_template() -> bytes:
+    """
+    Encode the session.update message once, leaving %-placeholders for the
+    per-connection values (instructions, voice, silence duration).
+    """
+    session_config = {
+        "type": "session.update",
+        "session": {
+            "modalities": ["text", "audio"],
+            "instructions": "__INSTRUCTIONS__",
+            "voice": "__VOICE__",
+            # Use G.711 μ-law to match Twilio's audio format (no conversion needed)
+            "input_audio_format": "g711_ulaw",
+            "output_audio_format": "g711_ulaw",
+            "input_audio_transcription": {
+                "model": "whisper-1",
+            },
+            "turn_detection": {
+                "type": "server_vad",
+                # Higher threshold = less sensitive to background noise (0.7 is conservative)
+                "threshold": 0.7,
+                # Require 1.5+ seconds of sustained speech before triggering interruption
+                # This prevents the AI from stopping mid-sentence on brief sounds or "uh-huh"
+                "prefix_padding_ms": 1500,
+                # How long to wait for silence before considering speech done
+                "silence_duration_ms": "__SILENCE_MS__",
+                # Automatically create response when user finishes speaking
+                "create_response": True,
+            },
+            # Temperature for more natural, varied responses
+            "temperature": 0.8,
+            # No token limit - let her speak as long as needed
+            # (Previously 300 was causing mid-sentence cutoffs)
+            "max_response_output_tokens": "inf",
+        },
+    }
+    return (
+        orjson.dumps(session_config)
+        .replace(b"%", b"%%")
+        .replace(b'"__INSTRUCTIONS__"', b"%s")
+        .replace(b'"__VOICE__"', b"%s")
+        .replace(b'"__SILENCE_MS__"', b"%d")
+    )
+
+
+# Static session.update JSON; only instructions, voice and silence_duration_ms vary
+_SESSION_UPDATE_TEMPLATE = _build_session_update_template()
+
+# The default instructions are the same on every call, so JSON-encode them once
+_COMPACT_PROMPT_JSON = orjson.dumps(VOICE_AGENT_PROMPT_COMPACT)
+
+# Audio deltas dominate the Realtime event stream. The API emits compact JSON with
+# "type" as the first key, so these frames can be recognised by a prefix compare
+# (and their base64 payload sliced out) without a full json.loads of the message.
+_AUDIO_DELTA_PREFIX = '{"type":"response.audio.delta"'
+_DELTA_KEY = '"delta":"'
+
+
+def _scan_audio_delta(message: str) -> Optional[str]:
+    """
+    Extract the base64 payload of an audio delta frame without JSON parsing.
+
+    Args:
+        message: Raw text frame received from the Realtime API
+
+    Returns:
+        The base64 audio payload, or None if the frame is not an audio delta
+        (or does not have the expected shape, in which case callers fall back
+        to full parsing).
+    """
+    if not message.startswith(_AUDIO_DELTA_PREFIX):
+        return None
+    start = message.find(_DELTA_KEY)
+    if start < 0:
+        return None
+    start += len(_DELTA_KEY)
+    # Base64 never contains quotes or escapes, so the next quote ends the value
+    end = message.find('"', start)
+    if end < 0:
+        return None
+    return message[start:end]
+
+
+@dataclass(slots=True)
 class RealtimeEvent:
-    """Represents an event from the OpenAI Realtime API."""
+    """
+    Represents an event from the OpenAI Realtime API.
+    
+    One of these is allocated per received frame (mostly audio deltas), so the
+    class is slotted to keep construction and attribute access cheap.
+    """
     type: str
     data: dict = field(default_factory=dict)
     
     @property
     def event_type(self) -> Optional[RealtimeEventType]:
         """Get the typed event type if recognized."""
-        try:
-            return RealtimeEventType(self.type)
-        except ValueError:
-            return None
+        return _EVENT_TYPE_MAP.get(self.type)
     
     @property
     def is_audio_delta(self) -> bool:
         """Check if this is an audio delta event."""
-        return self.type == RealtimeEventType.RESPONSE_AUDIO_DELTA
+        return self.type == _AUDIO_DELTA
     
     @property
     def is_speech_started(self) -> bool:
         """Check if user started speaking (for barge-in)."""
-        return self.type == RealtimeEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED
+        return self.type == _SPEECH_STARTED
     
     @property
     def is_transcript_complete(self) -> bool:
         """Check if input transcription is complete."""
-        return self.type == RealtimeEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED
+        return self.type == _TRANSCRIPT_COMPLETED
     
     @property
     def is_error(self) -> bool:
         """Check if this is an error event."""
-        return self.type == RealtimeEventType.ERROR
+        return self.type == _ERROR
     
     @property
     def audio_delta(self) -> Optional[str]:
-        """Get the base64-encoded audio delta if present."""
+        """
+        Get the base64-encoded audio delta if present.
+        
+        Kept as base64 text: both legs of the call use g711_ulaw, so the
+        payload is forwarded to Twilio as-is without ever being decoded.
+        """
         if self.is_audio_delta:
             return self.data.get("delta")
         return None
@@ -118,11 +237,40 @@ class RealtimeEvent:
     def error_message(self) -> Optional[str]:
         """Get the error message if this is an error event."""
         if self.is_error:
-            error = self.data.get("error", {})
-            return error.get("message", str(error))
+            return _error_message(self.data)
         return None
 
 
+def _noop(*args) -> None:
+    """Default event handler (nothing registered)."""
+
+
+def _warn_if_not_uvloop() -> None:
+    """
+    Warn (once) if the Realtime client is not running under uvloop.
+    
+    The voice stack does many small WebSocket sends/receives per call; uvloop's
+    C-level scheduler and socket I/O noticeably cut per-frame overhead. uvicorn
+    picks it automatically (loop="auto") when the uvloop package is installed.
+    """
+    global _loop_checked
+    if _loop_checked:
+        return
+    _loop_checked = True
+    loop_module = type(asyncio.get_running_loop()).__module__
+    if not loop_module.startswith("uvloop"):
+        logger.warning(
+            "Realtime client running on %s event loop; install uvloop for lower per-frame overhead",
+            loop_module,
+        )
+
+
+def _error_message(data: dict) -> str:
+    """Get the error message from an error event payload."""
+    error = data.get("error", {})
+    return error.get("message", str(error))
+
+
 class OpenAIRealtimeClient:
     """
     Client for the OpenAI Realtime API.
@@ -152,21 +300,61 @@ class OpenAIRealtimeClient:
         self.voice = voice or settings.openai_realtime_voice
         self.system_prompt = system_prompt or VOICE_AGENT_PROMPT_COMPACT
         
-        self._ws: Optional[WebSocketClientProtocol] = None
+        # Settings used during the call, read once here so no pydantic attribute
+        # access happens on the connect/send/receive paths
+        self._ws_backend = settings.realtime_ws_backend
+        self._silence_duration_ms = settings.silence_duration_ms
+        
+        self._ws: Optional[Union[ClientConnection, "PicowsConnection"]] = None
         self._connected = False
         self._session_id: Optional[str] = None
         
-        # Event handlers
-        self._on_audio_delta: Optional[Callable[[str], None]] = None
-        self._on_speech_started: Optional[Callable[[], None]] = None
-        self._on_transcript: Optional[Callable[[str], None]] = None
-        self._on_error: Optional[Callable[[str], None]] = None
+        # Event handlers (no-ops until registered, so dispatch can call unconditionally)
+        self._on_audio_delta: Callable[[str], None] = _noop
+        self._on_speech_started: Callable[[], None] = _noop
+        self._on_transcript: Callable[[str], None] = _noop
+        self._on_error: Callable[[str], None] = _noop
+        
+        # Outbound caller audio, forwarded by a background sender task that
+        # coalesces chunks which queue up behind an in-flight send. The queue is
+        # bounded: if the socket stalls, the oldest audio is dropped (stale audio
+        # is useless in a live conversation) instead of buffering without limit.
+        self._send_q: asyncio.Queue[str] = asyncio.Queue(
+            maxsize=max(1, settings.realtime_outbound_max)
+        )
+        self._send_batch = max(1, settings.realtime_send_batch)
+        self._sender_task: Optional[asyncio.Task] = None
+        # Set by the sender when the socket closes under it; re-raised to callers
+        # of send_audio so the bridge ends the call instead of queueing into a void
+        self._send_error: Optional[Exception] = None
+        
+        # Monotonic count of audio deltas received this session, so consumers
+        # can compare it with what they forwarded and detect silent loss
+        self._audio_deltas_received = 0
+        
+        # Skip JSON parsing for audio delta frames (see _scan_audio_delta)
+        self._audio_fast_path = settings.realtime_audio_fast_path
+        self._dropped_audio_chunks = 0
+        self._last_drop_warning = 0.0
+        
+        # Handler dispatch for received events, keyed on the raw event type
+        self._dispatch: dict[str, Callable[[dict], None]] = {
+            _ERROR: self._dispatch_error,
+            _SPEECH_STARTED: self._dispatch_speech_started,
+            _TRANSCRIPT_COMPLETED: self._dispatch_transcript,
+            _AUDIO_DELTA: self._dispatch_audio_delta,
+        }
     
     @property
     def is_connected(self) -> bool:
         """Check if connected to the Realtime API."""
         return self._connected and self._ws is not None
     
+    @property
+    def audio_deltas_received(self) -> int:
+        """Number of audio delta events received in the current session."""
+        return self._audio_deltas_received
+    
     @property
     def realtime_url(self) -> str:
         """Get the Realtime API WebSocket URL."""
@@ -188,6 +376,28 @@ class OpenAIRealtimeClient:
         """Register handler for error events."""
         self._on_error = handler
     
+    def _dispatch_error(self, data: dict) -> None:
+        """Log an error event and notify the error handler."""
+        message = _error_message(data)
+        logger.error("Realtime API error: %s", message)
+        self._on_error(message)
+    
+    def _dispatch_speech_started(self, data: dict) -> None:
+        """Notify the speech started handler (barge-in)."""
+        logger.debug("User speech started (barge-in)")
+        self._on_speech_started()
+    
+    def _dispatch_transcript(self, data: dict) -> None:
+        """Log a completed input transcript and notify the transcript handler."""
+        transcript = data.get("transcript")
+        logger.info("Transcript: %s", transcript)
+        self._on_transcript(transcript)
+    
+    def _dispatch_audio_delta(self, data: dict) -> None:
+        """Count an audio delta and notify the audio delta handler."""
+        self._audio_deltas_received += 1
+        self._on_audio_delta(data.get("delta"))
+    
     @asynccontextmanager
     async def connect(self):
         """
@@ -202,75 +412,94 @@ class OpenAIRealtimeClient:
             "OpenAI-Beta": "realtime=v1",
         }
         
+        _warn_if_not_uvloop()
+        
         try:
-            logger.info(f"Connecting to OpenAI Realtime API: {self.realtime_url}")
+            logger.info("Connecting to OpenAI Realtime API: %s", self.realtime_url)
             
-            self._ws = await websockets.connect(
-                self.realtime_url,
-                additional_headers=headers,
-                ping_interval=20,
-                ping_timeout=20,
-            )
+            if self._ws_backend == "picows":
+                try:
+                    from .picows_transport import connect_picows
+                except ImportError:
+                    raise ImportError(
+                        "picows package required for realtime_ws_backend='picows'. "
+                        "Install with: pip install picows"
+                    )
+                self._ws = await connect_picows(
+                    self.realtime_url,
+                    headers,
+                    ping_interval=20,
+                    ping_timeout=20,
+                )
+            else:
+                self._ws = await websockets.connect(
+                    self.realtime_url,
+                    additional_headers=headers,
+                    ping_interval=20,
+                    ping_timeout=20,
+                    # Frames are mostly base64 μ-law audio, which doesn't compress;
+                    # permessage-deflate would only burn CPU on every frame
+                    compression=None,
+                )
             self._connected = True
+            self._audio_deltas_received = 0
             
             # Configure the session
             await self._configure_session()
             
+            # Start forwarding queued audio (drop anything left from a previous session)
+            while not self._send_q.empty():
+                self._send_q.get_nowait()
+            self._send_error = None
+            self._sender_task = asyncio.create_task(self._audio_sender())
+            
             logger.info("Connected to OpenAI Realtime API")
             yield self
             
         except Exception as e:
-            logger.error(f"Failed to connect to OpenAI Realtime API: {e}")
+            logger.error("Failed to connect to OpenAI Realtime API: %s", e)
             raise
         finally:
             self._connected = False
+            if self._sender_task:
+                self._sender_task.cancel()
+                try:
+                    await self._sender_task
+                except asyncio.CancelledError:
+                    pass
+                self._sender_task = None
             if self._ws:
                 await self._ws.close()
                 self._ws = None
     
     async def _configure_session(self) -> None:
         """Configure the Realtime session after connection."""
-        session_config = {
-            "type": "session.update",
-            "session": {
-                "modalities": ["text", "audio"],
-                "instructions": self.system_prompt,
-                "voice": self.voice,
-                # Use G.711 μ-law to match Twilio's audio format (no conversion needed)
-                "input_audio_format": "g711_ulaw",
-                "output_audio_format": "g711_ulaw",
-                "input_audio_transcription": {
-                    "model": "whisper-1",
-                },
-                "turn_detection": {
-                    "type": "server_vad",
-                    # Higher threshold = less sensitive to background noise (0.7 is conservative)
-                    "threshold": 0.7,
-                    # Require 1.5+ seconds of sustained speech before triggering interruption
-                    # This prevents the AI from stopping mid-sentence on brief sounds or "uh-huh"
-                    "prefix_padding_ms": 1500,
-                    # How long to wait for silence before considering speech done
-                    "silence_duration_ms": settings.silence_duration_ms,
-                    # Automatically create response when user finishes speaking
-                    "create_response": True,
-                },
-                # Temperature for more natural, varied responses
-                "temperature": 0.8,
-                # No token limit - let her speak as long as needed
-                # (Previously 300 was causing mid-sentence cutoffs)
-                "max_response_output_tokens": "inf",
-            },
-        }
+        if self.system_prompt is VOICE_AGENT_PROMPT_COMPACT:
+            instructions_json = _COMPACT_PROMPT_JSON
+        else:
+            instructions_json = orjson.dumps(self.system_prompt)
+        payload = _SESSION_UPDATE_TEMPLATE % (
+            instructions_json,
+            orjson.dumps(self.voice),
+            self._silence_duration_ms,
+        )
         
-        await self._send(session_config)
-        logger.info(f"OpenAI session configured: voice={self.voice}, model={self.model}, audio=g711_ulaw")
+        await self._send_raw(payload)
+        logger.info("OpenAI session configured: voice=%s, model=%s, audio=g711_ulaw", self.voice, self.model)
     
     async def _send(self, message: dict) -> None:
         """Send a message to the Realtime API."""
         if not self._ws:
             raise RuntimeError("Not connected to OpenAI Realtime API")
         
-        await self._ws.send(json.dumps(message))
+        await self._send_raw(orjson.dumps(message))
+    
+    async def _send_raw(self, payload: bytes) -> None:
+        """Send a pre-encoded JSON message to the Realtime API."""
+        if not self._ws:
+            raise RuntimeError("Not connected to OpenAI Realtime API")
+        
+        await self._ws.send(payload, text=True)
     
     async def send_audio(self, audio_b64: str) -> None:
         """
@@ -278,16 +507,76 @@ class OpenAIRealtimeClient:
         
         Args:
             audio_b64: Base64-encoded audio data (PCMU from Twilio)
+        
+        Raises:
+            websockets.exceptions.ConnectionClosed: If the connection closed
+                while the sender was forwarding queued audio
         """
+        if self._send_error is not None:
+            raise self._send_error
         if not self.is_connected:
             logger.warning("Cannot send audio: not connected")
             return
         
-        message = {
-            "type": "input_audio_buffer.append",
-            "audio": audio_b64,
-        }
-        await self._send(message)
+        queue = self._send_q
+        if queue.full():
+            # Backpressure: drop the oldest chunk rather than grow the backlog
+            queue.get_nowait()
+            self._dropped_audio_chunks += 1
+            now = time.monotonic()
+            if now - self._last_drop_warning >= DROP_WARNING_INTERVAL_S:
+                logger.warning(
+                    "Realtime send backlog full - dropped %d stale audio chunks",
+                    self._dropped_audio_chunks,
+                )
+                self._last_drop_warning = now
+                self._dropped_audio_chunks = 0
+        queue.put_nowait(audio_b64)
+    
+    async def _audio_sender(self) -> None:
+        """
+        Forward queued audio to the Realtime API.
+        
+        Chunks that queued up while a send was in flight (up to
+        settings.realtime_send_batch) are merged into a single
+        input_audio_buffer.append, so a slow socket costs fewer sends rather
+        than a growing backlog. When the sender keeps up, each chunk goes out
+        on its own and no latency is added.
+        """
+        queue = self._send_q
+        max_batch = self._send_batch
+        # Reused framing buffer: the prefix stays in place and only the payload
+        # and suffix are rewritten per send (both transports copy on send)
+        out_buf = bytearray(_APPEND_PREFIX)
+        prefix_len = len(_APPEND_PREFIX)
+        while True:
+            audio_b64 = await queue.get()
+            try:
+                if max_batch > 1 and not queue.empty():
+                    # Base64 chunks can't be concatenated as text (padding), so
+                    # merge the raw μ-law bytes and re-encode once
+                    chunks = [_b64decode(audio_b64)]
+                    while len(chunks) < max_batch and not queue.empty():
+                        chunks.append(_b64decode(queue.get_nowait()))
+                    payload = _b64encode(b"".join(chunks))
+                else:
+                    payload = audio_b64.encode()
+                
+                # Base64 is plain ASCII, so the payload can be spliced in without escaping
+                del out_buf[prefix_len:]
+                out_buf += payload
+                out_buf += _APPEND_SUFFIX
+                await self._ws.send(out_buf, text=True)
+            except asyncio.CancelledError:
+                raise
+            except websockets.exceptions.ConnectionClosed as e:
+                logger.info("Realtime connection closed while sending audio: %s", e)
+                self._connected = False
+                self._send_error = e
+                return
+            except Exception as e:
+                # One bad chunk (e.g. invalid base64) must not stop the sender
+                logger.error("Error sending audio to Realtime API: %s", e)
     
     async def commit_audio(self) -> None:
         """Commit the audio buffer to finalize input."""
@@ -349,63 +638,86 @@ class OpenAIRealtimeClient:
             },
         })
     
+    def _process_message(self, message: str) -> Optional[dict]:
+        """
+        Parse one Realtime frame and call the registered handlers.
+        
+        Args:
+            message: Raw text frame from the WebSocket
+        
+        Returns:
+            The event payload, or None if the frame could not be parsed
+        """
+        # Fast path: forward audio deltas without building the full event dict
+        if self._audio_fast_path:
+            audio_delta = _scan_audio_delta(message)
+            if audio_delta is not None:
+                self._audio_deltas_received += 1
+                self._on_audio_delta(audio_delta)
+                return {"type": _AUDIO_DELTA, "delta": audio_delta}
+        
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse Realtime message: %s", e)
+            return None
+        
+        # Log important events and call registered handlers
+        handler = self._dispatch.get(data.get("type"))
+        if handler is not None:
+            handler(data)
+        
+        return data
+    
     async def receive_events(self) -> AsyncIterator[RealtimeEvent]:
         """
         Receive events from the Realtime API.
         
+        Registered handlers are called for each event before it is yielded.
+        
         Yields:
             RealtimeEvent objects for each received event
         """
         if not self._ws:
             raise RuntimeError("Not connected to OpenAI Realtime API")
         
+        process_message = self._process_message
         try:
             async for message in self._ws:
-                try:
-                    data = json.loads(message)
-                    event_type = data.get("type", "unknown")
-                    
-                    event = RealtimeEvent(type=event_type, data=data)
-                    
-                    # Log important events
-                    if event.is_error:
-                        logger.error(f"Realtime API error: {event.error_message}")
-                        if self._on_error:
-                            self._on_error(event.error_message)
-                    elif event.is_speech_started:
-                        logger.debug("User speech started (barge-in)")
-                        if self._on_speech_started:
-                            self._on_speech_started()
-                    elif event.is_transcript_complete:
-                        logger.info(f"Transcript: {event.transcript}")
-                        if self._on_transcript:
-                            self._on_transcript(event.transcript)
-                    elif event.is_audio_delta:
-                        if self._on_audio_delta:
-                            self._on_audio_delta(event.audio_delta)
-                    
-                    yield event
-                    
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse Realtime message: {e}")
+                data = process_message(message)
+                if data is not None:
+                    yield RealtimeEvent(type=data.get("type", "unknown"), data=data)
                     
         except asyncio.CancelledError:
             logger.info("Realtime event loop cancelled")
             raise
         except websockets.exceptions.ConnectionClosed as e:
-            logger.info(f"Realtime connection closed: {e}")
+            logger.info("Realtime connection closed: %s", e)
         except Exception as e:
-            logger.error(f"Error receiving Realtime events: {e}")
+            logger.error("Error receiving Realtime events: %s", e)
             raise
     
     async def run_event_loop(self) -> None:
         """
         Run the event loop, dispatching events to registered handlers.
         
-        This is a convenience method that processes all events and
-        calls the appropriate handlers.
+        This is a convenience method for handler-only consumers: frames are
+        processed directly, without the receive_events generator or
+        RealtimeEvent wrappers.
         """
-        async for event in self.receive_events():
-            # Events are already dispatched in receive_events
-            # This method just keeps the loop running
-            pass
+        if not self._ws:
+            raise RuntimeError("Not connected to OpenAI Realtime API")
+        
+        process_message = self._process_message
+        try:
+            async for message in self._ws:
+                process_message(message)
+                    
+        except asyncio.CancelledError:
+            logger.info("Realtime event loop cancelled")
+            raise
+        except websockets.exceptions.ConnectionClosed as e:
+            logger.info("Realtime connection closed: %s", e)
+        except Exception as e:
+            logger.error("Error receiving Realtime events: %s", e)
+            raise
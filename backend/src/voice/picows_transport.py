@@ -0,0 +1,130 @@
+"""
+picows-backed WebSocket transport for the OpenAI Realtime client.
+
+picows parses WebSocket frames in Cython and hands them to a listener callback,
+avoiding the per-message queue/latch machinery of the websockets client. This
+module wraps it in the small websockets-style surface OpenAIRealtimeClient uses
+(send / async iteration / close), so the client code is the same for both backends.
+
+Requires the optional picows package (pip install picows).
+"""
+
+import asyncio
+from typing import Mapping, Optional, Union
+
+from picows import WSCloseCode, WSFrame, WSListener, WSMsgType, WSTransport, ws_connect
+from websockets.exceptions import ConnectionClosedError
+
+
+class _RealtimeListener(WSListener):
+    """Collects complete text messages from picows frame callbacks."""
+
+    def __init__(self) -> None:
+        # None marks the end of the stream (connection closed)
+        self.messages: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self._fragments: list[bytes] = []
+        # Cleared while the transport's write buffer is above its high-water mark
+        self.writable = asyncio.Event()
+        self.writable.set()
+
+    def on_ws_frame(self, transport: WSTransport, frame: WSFrame) -> None:
+        msg_type = frame.msg_type
+        if msg_type == WSMsgType.TEXT and frame.fin:
+            # Common case: the whole message arrives in a single frame
+            self.messages.put_nowait(frame.get_payload_as_utf8_text())
+        elif msg_type == WSMsgType.TEXT or msg_type == WSMsgType.CONTINUATION:
+            self._fragments.append(frame.get_payload_as_bytes())
+            if frame.fin:
+                self.messages.put_nowait(b"".join(self._fragments).decode())
+                self._fragments.clear()
+        elif msg_type == WSMsgType.CLOSE:
+            transport.send_close(frame.get_close_code(), frame.get_close_message())
+            transport.disconnect()
+
+    def on_ws_disconnected(self, transport: WSTransport) -> None:
+        self.messages.put_nowait(None)
+        self.writable.set()
+
+    def pause_writing(self) -> None:
+        self.writable.clear()
+
+    def resume_writing(self) -> None:
+        self.writable.set()
+
+
+class PicowsConnection:
+    """websockets-style connection wrapper around a picows transport."""
+
+    def __init__(self, transport: WSTransport, listener: _RealtimeListener):
+        self._transport = transport
+        self._messages = listener.messages
+        self._writable = listener.writable
+
+    async def send(self, message: Union[str, bytes], text: bool = True) -> None:
+        """
+        Send a message as a single frame (text by default).
+
+        picows writes synchronously, so wait for the write buffer to drain
+        when it is over the high-water mark (like websockets does on send).
+        
+        Raises:
+            ConnectionClosedError: If the connection is closed; picows would
+                otherwise drop the frame silently
+        """
+        if self._transport.is_disconnected:
+            raise ConnectionClosedError(None, None)
+        if isinstance(message, str):
+            message = message.encode()
+        self._transport.send(WSMsgType.TEXT if text else WSMsgType.BINARY, message)
+        if not self._writable.is_set():
+            await self._writable.wait()
+
+    def __aiter__(self) -> "PicowsConnection":
+        return self
+
+    async def __anext__(self) -> str:
+        # Drain frames that are already queued without creating a get() coroutine;
+        # only await when the queue is empty
+        try:
+            message = self._messages.get_nowait()
+        except asyncio.QueueEmpty:
+            message = await self._messages.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+    async def close(self) -> None:
+        """Close the connection and wait for the transport to shut down."""
+        if not self._transport.is_disconnected:
+            self._transport.send_close(WSCloseCode.OK)
+            self._transport.disconnect()
+        await self._transport.wait_disconnected()
+
+
+async def connect_picows(
+    url: str,
+    headers: Mapping[str, str],
+    ping_interval: float = 20,
+    ping_timeout: float = 20,
+) -> PicowsConnection:
+    """
+    Open a picows WebSocket connection.
+
+    Args:
+        url: WebSocket URL (ws:// or wss://)
+        headers: Extra handshake headers
+        ping_interval: Idle time before sending a keepalive ping (seconds)
+        ping_timeout: Time to wait for the pong before disconnecting (seconds)
+
+    Returns:
+        Connected PicowsConnection
+    """
+    transport, listener = await ws_connect(
+        _RealtimeListener,
+        url,
+        extra_headers=headers,
+        enable_auto_ping=True,
+        auto_ping_idle_timeout=ping_interval,
+        auto_ping_reply_timeout=ping_timeout,
+    )
+    return PicowsConnection(transport, listener)
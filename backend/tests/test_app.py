@@ -3,31 +3,46 @@
 import os
 os.environ["OPENAI_API_KEY"] = "test-key-for-import-only"
 
-from fastapi.testclient import TestClient
-from src.voice.app import app
+import asyncio
 
-def test_app():
-    client = TestClient(app)
+import httpx
+import pytest
+
+@pytest.mark.asyncio
+async def test_app():
+    # Imported here so collecting this module doesn't load FastAPI and the voice stack
+    from src.voice.app import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await _run_app_checks(client)
+
+
+async def _run_app_checks(client: httpx.AsyncClient):
+    # The read-only endpoints are independent, so request them concurrently
+    root, health, calls = await asyncio.gather(
+        client.get("/"),
+        client.get("/health"),
+        client.get("/calls"),
+    )
     
     # Test 1: Root endpoint
     print("Test 1: Root endpoint...")
-    response = client.get("/")
-    assert response.status_code == 200
-    data = response.json()
+    assert root.status_code == 200
+    data = root.json()
     print(f"  Service: {data['service']}")
     print(f"  Status: {data['status']}")
     
     # Test 2: Health check
     print("\nTest 2: Health check endpoint...")
-    response = client.get("/health")
-    assert response.status_code == 200
-    data = response.json()
+    assert health.status_code == 200
+    data = health.json()
     print(f"  Status: {data['status']}")
     print(f"  Model: {data['config']['realtime_model']}")
     
     # Test 3: Twilio voice webhook (TwiML response)
     print("\nTest 3: Twilio voice webhook...")
-    response = client.post("/twilio/voice", data={
+    response = await client.post("/twilio/voice", data={
         "CallSid": "CA123456",
         "From": "+15551234567"
     })
@@ -39,14 +54,13 @@ def test_app():
     
     # Test 4: Active calls endpoint
     print("\nTest 4: Active calls endpoint...")
-    response = client.get("/calls")
-    assert response.status_code == 200
-    data = response.json()
+    assert calls.status_code == 200
+    data = calls.json()
     print(f"  Active calls: {len(data['active_calls'])}")
     
     # Test 5: Call not found
     print("\nTest 5: Call not found (404)...")
-    response = client.get("/calls/nonexistent")
+    response = await client.get("/calls/nonexistent")
     assert response.status_code == 404
     print(f"  Status: 404 (as expected)")
     
@@ -56,4 +70,4 @@ def test_app():
 
 
 if __name__ == "__main__":
-    test_app()
+    asyncio.run(test_app())
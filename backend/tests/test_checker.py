@@ -7,7 +7,7 @@ Verifies that check_claim() correctly:
 - Generates targeted follow-up questions
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -27,6 +27,19 @@ from src.fnol.schema import (
 )
 
 
+# Injected incident dates for the detection-rate cases, computed once at import
+# (naive UTC, matching what check_claim compares against)
+_NOW = datetime.now(timezone.utc).replace(tzinfo=None)
+_FUTURE_DATE = _NOW + timedelta(days=10)
+_OLD_DATE = _NOW - timedelta(days=800)
+
+# Empty sections, built once and shared (tests never mutate them)
+_EMPTY_CLAIMANT = ClaimantInfo()
+_EMPTY_INCIDENT = IncidentInfo()
+_EMPTY_PROPERTY = PropertyDamageInfo()
+_EMPTY_EVIDENCE = EvidenceChecklist()
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -86,14 +99,26 @@ def create_complete_claim() -> PropertyDamageClaim:
     )
 
 
+@pytest.fixture(scope="session")
+def complete_claim_template() -> PropertyDamageClaim:
+    """Complete claim built (and validated) once per session; never mutate it directly."""
+    return create_complete_claim()
+
+
+@pytest.fixture
+def complete_claim(complete_claim_template: PropertyDamageClaim) -> PropertyDamageClaim:
+    """Fresh deep copy of the complete claim; tests may mutate it freely."""
+    return complete_claim_template.model_copy(deep=True)
+
+
 # ============================================================================
 # Completeness Score Tests
 # ============================================================================
 
 
-def test_complete_claim_perfect_score():
+def test_complete_claim_perfect_score(complete_claim):
     """Complete claim with all evidence should score 1.0."""
-    claim = create_complete_claim()
+    claim = complete_claim
     report = check_claim(claim)
 
     assert report.completeness_score == pytest.approx(1.0, abs=0.01)
@@ -104,7 +129,7 @@ def test_missing_all_critical_evidence():
     """Missing all critical (Tier 1) evidence should score ≤0.4."""
     claim = PropertyDamageClaim(
         claim_id="TEST-002",
-        claimant=ClaimantInfo(),
+        claimant=_EMPTY_CLAIMANT,
         incident=IncidentInfo(
             incident_date=datetime.utcnow() - timedelta(days=5),
             incident_location="123 Main St",
@@ -135,9 +160,9 @@ def test_missing_all_critical_evidence():
     assert "property_type" in report.missing_required_evidence
 
 
-def test_missing_important_evidence():
+def test_missing_important_evidence(complete_claim):
     """Missing important (Tier 2) evidence should have moderate impact."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     # Remove Tier 2 evidence
     claim.incident.incident_location = None
@@ -157,9 +182,9 @@ def test_missing_important_evidence():
     assert "estimated_repair_cost" in report.missing_required_evidence
 
 
-def test_missing_supporting_evidence():
+def test_missing_supporting_evidence(complete_claim):
     """Missing supporting (Tier 3) evidence should have minimal impact."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     # Remove Tier 3 evidence
     claim.evidence.has_repair_estimate = False
@@ -184,21 +209,23 @@ def test_missing_supporting_evidence():
 # ============================================================================
 
 
-def test_detect_low_confidence_critical_fields():
+def test_detect_low_confidence_critical_fields(complete_claim):
     """Should detect low confidence (<0.3) on critical fields."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     # Set low confidence on damage type
-    claim.incident.damage_type_provenance.confidence = 0.2
+    claim.incident.damage_type_provenance = claim.incident.damage_type_provenance.model_copy(
+        update={"confidence": 0.2}
+    )
 
     report = check_claim(claim)
 
     assert any("Low confidence on damage type" in c for c in report.contradictions)
 
 
-def test_detect_severity_cost_mismatch_severe_low_cost():
+def test_detect_severity_cost_mismatch_severe_low_cost(complete_claim):
     """Should detect SEVERE damage with low cost (<$1k)."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     claim.property_damage.damage_severity = DamageSeverity.SEVERE
     claim.property_damage.estimated_repair_cost = 500.0
@@ -208,9 +235,9 @@ def test_detect_severity_cost_mismatch_severe_low_cost():
     assert any("SEVERE" in c and "500" in c for c in report.contradictions)
 
 
-def test_detect_severity_cost_mismatch_minor_high_cost():
+def test_detect_severity_cost_mismatch_minor_high_cost(complete_claim):
     """Should detect MINOR damage with high cost (>$10k)."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     claim.property_damage.damage_severity = DamageSeverity.MINOR
     claim.property_damage.estimated_repair_cost = 15000.0
@@ -220,9 +247,9 @@ def test_detect_severity_cost_mismatch_minor_high_cost():
     assert any("MINOR" in c and "15000" in c for c in report.contradictions)
 
 
-def test_detect_no_photos_but_description():
+def test_detect_no_photos_but_description(complete_claim):
     """Should detect incident description without photos."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     claim.evidence.has_damage_photos = False
     claim.evidence.damage_photo_count = 0
@@ -232,9 +259,9 @@ def test_detect_no_photos_but_description():
     assert any("no damage photos" in c for c in report.contradictions)
 
 
-def test_detect_high_cost_without_estimate():
+def test_detect_high_cost_without_estimate(complete_claim):
     """Should detect high cost (>$5k) without repair estimate doc."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     claim.property_damage.estimated_repair_cost = 8000.0
     claim.evidence.has_repair_estimate = False
@@ -244,9 +271,9 @@ def test_detect_high_cost_without_estimate():
     assert any("8000" in c and "no repair estimate document" in c for c in report.contradictions)
 
 
-def test_detect_future_incident_date():
+def test_detect_future_incident_date(complete_claim):
     """Should detect incident date in the future."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     claim.incident.incident_date = datetime.utcnow() + timedelta(days=10)
 
@@ -255,9 +282,9 @@ def test_detect_future_incident_date():
     assert any("future" in c.lower() for c in report.contradictions)
 
 
-def test_detect_old_incident_date():
+def test_detect_old_incident_date(complete_claim):
     """Should detect incident date >2 years old."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     claim.incident.incident_date = datetime.utcnow() - timedelta(days=800)  # >2 years
 
@@ -266,20 +293,22 @@ def test_detect_old_incident_date():
     assert any("2 years old" in c for c in report.contradictions)
 
 
-def test_detect_location_low_confidence():
+def test_detect_location_low_confidence(complete_claim):
     """Should detect location provided with low confidence."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
-    claim.incident.incident_location_provenance.confidence = 0.2
+    claim.incident.incident_location_provenance = claim.incident.incident_location_provenance.model_copy(
+        update={"confidence": 0.2}
+    )
 
     report = check_claim(claim)
 
     assert any("location" in c.lower() and "low confidence" in c.lower() for c in report.contradictions)
 
 
-def test_multiple_contradictions():
+def test_multiple_contradictions(complete_claim):
     """Should detect multiple contradictions in a single claim."""
-    claim = create_complete_claim()
+    claim = complete_claim
 
     # Add multiple issues
     claim.property_damage.damage_severity = DamageSeverity.SEVERE
@@ -297,9 +326,9 @@ def test_multiple_contradictions():
 # ============================================================================
 
 
-def test_recommend_questions_for_missing_photos():
+def test_recommend_questions_for_missing_photos(complete_claim):
     """Should ask for photos when missing."""
-    claim = create_complete_claim()
+    claim = complete_claim
     claim.evidence.has_damage_photos = False
     claim.evidence.damage_photo_count = 0
 
@@ -308,9 +337,9 @@ def test_recommend_questions_for_missing_photos():
     assert any("photo" in q.lower() for q in report.recommended_questions)
 
 
-def test_recommend_questions_for_missing_location():
+def test_recommend_questions_for_missing_location(complete_claim):
     """Should ask for location when missing."""
-    claim = create_complete_claim()
+    claim = complete_claim
     claim.incident.incident_location = None
 
     report = check_claim(claim)
@@ -318,9 +347,9 @@ def test_recommend_questions_for_missing_location():
     assert any("address" in q.lower() or "location" in q.lower() for q in report.recommended_questions)
 
 
-def test_recommend_questions_for_missing_date():
+def test_recommend_questions_for_missing_date(complete_claim):
     """Should ask for date when missing."""
-    claim = create_complete_claim()
+    claim = complete_claim
     claim.incident.incident_date = None
 
     report = check_claim(claim)
@@ -328,9 +357,9 @@ def test_recommend_questions_for_missing_date():
     assert any("when" in q.lower() for q in report.recommended_questions)
 
 
-def test_recommend_questions_for_missing_cost():
+def test_recommend_questions_for_missing_cost(complete_claim):
     """Should ask for cost/estimate when missing."""
-    claim = create_complete_claim()
+    claim = complete_claim
     claim.property_damage.estimated_repair_cost = None
 
     report = check_claim(claim)
@@ -338,9 +367,9 @@ def test_recommend_questions_for_missing_cost():
     assert any("estimate" in q.lower() or "cost" in q.lower() for q in report.recommended_questions)
 
 
-def test_recommend_questions_for_unknown_damage_type():
+def test_recommend_questions_for_unknown_damage_type(complete_claim):
     """Should ask to clarify damage type when unknown."""
-    claim = create_complete_claim()
+    claim = complete_claim
     claim.incident.damage_type = DamageType.UNKNOWN
 
     report = check_claim(claim)
@@ -348,9 +377,9 @@ def test_recommend_questions_for_unknown_damage_type():
     assert any("caused" in q.lower() or "damage" in q.lower() for q in report.recommended_questions)
 
 
-def test_recommend_questions_for_unknown_severity():
+def test_recommend_questions_for_unknown_severity(complete_claim):
     """Should ask for severity clarification when unknown."""
-    claim = create_complete_claim()
+    claim = complete_claim
     claim.property_damage.damage_severity = DamageSeverity.UNKNOWN
 
     report = check_claim(claim)
@@ -362,7 +391,7 @@ def test_recommended_questions_limited_to_three():
     """Should limit recommended questions to 3 max."""
     claim = PropertyDamageClaim(
         claim_id="TEST-MANY-MISSING",
-        claimant=ClaimantInfo(),
+        claimant=_EMPTY_CLAIMANT,
         incident=IncidentInfo(
             damage_type=DamageType.UNKNOWN
         ),
@@ -380,9 +409,9 @@ def test_recommended_questions_limited_to_three():
     assert len(report.recommended_questions) <= 3
 
 
-def test_complete_claim_no_questions():
+def test_complete_claim_no_questions(complete_claim):
     """Complete claim with no issues should have no questions."""
-    claim = create_complete_claim()
+    claim = complete_claim
     report = check_claim(claim)
 
     # Should have no or very few questions
@@ -398,7 +427,7 @@ def test_claim_with_no_provenance():
     """Should handle claim with no provenance data."""
     claim = PropertyDamageClaim(
         claim_id="TEST-NO-PROV",
-        claimant=ClaimantInfo(),
+        claimant=_EMPTY_CLAIMANT,
         incident=IncidentInfo(
             incident_description="Water damage",
             damage_type=DamageType.WATER
@@ -423,10 +452,10 @@ def test_empty_claim():
     """Should handle minimal/empty claim gracefully."""
     claim = PropertyDamageClaim(
         claim_id="TEST-EMPTY",
-        claimant=ClaimantInfo(),
-        incident=IncidentInfo(),
-        property_damage=PropertyDamageInfo(),
-        evidence=EvidenceChecklist()
+        claimant=_EMPTY_CLAIMANT,
+        incident=_EMPTY_INCIDENT,
+        property_damage=_EMPTY_PROPERTY,
+        evidence=_EMPTY_EVIDENCE
     )
 
     report = check_claim(claim)
@@ -436,13 +465,13 @@ def test_empty_claim():
     assert len(report.missing_required_evidence) > 0
 
 
-def test_check_report_json_serializable():
+def test_check_report_json_serializable(complete_claim):
     """CheckReport should be JSON serializable."""
-    claim = create_complete_claim()
+    claim = complete_claim
     report = check_claim(claim)
 
     # Should not raise
-    json_data = report.dict()
+    json_data = report.model_dump(mode="json")
     assert isinstance(json_data, dict)
     assert "completeness_score" in json_data
     assert "missing_required_evidence" in json_data
@@ -455,41 +484,57 @@ def test_check_report_json_serializable():
 # ============================================================================
 
 
-def test_detection_rate_on_known_issues():
+# Claims with known issues: (name, {section: field updates}) applied to a complete claim
+_INJECTION_CASES = [
+    ("no_photos", {"evidence": {"has_damage_photos": False}}),
+    ("unknown_damage_type", {"incident": {"damage_type": DamageType.UNKNOWN}}),
+    ("unknown_property_type", {"property_damage": {"property_type": PropertyType.UNKNOWN}}),
+    ("no_description", {"incident": {"incident_description": None}}),
+    ("no_location", {"incident": {"incident_location": None}}),
+    ("no_date", {"incident": {"incident_date": None}}),
+    ("no_cost", {"property_damage": {"estimated_repair_cost": None}}),
+    ("future_date", {"incident": {"incident_date": _FUTURE_DATE}}),
+    ("old_date", {"incident": {"incident_date": _OLD_DATE}}),
+    ("severe_low_cost", {"property_damage": {
+        "damage_severity": DamageSeverity.SEVERE,
+        "estimated_repair_cost": 500.0,
+    }}),
+]
+
+
+def _apply_patch(claim: PropertyDamageClaim, patch: dict) -> None:
+    """
+    Replace each patched section of the claim with an updated shallow copy.
+
+    Unpatched sections stay shared with whatever claim was copied from, so the
+    caller only needs a shallow copy of the whole claim.
+    """
+    for section, update in patch.items():
+        setattr(claim, section, getattr(claim, section).model_copy(update=update))
+
+
+def _issue_detected(template: PropertyDamageClaim, patch: dict) -> bool:
+    """Whether check_claim flags a copy of template with patch applied."""
+    # Shallow copy: only the patched sections are copied, the rest are shared
+    # (read-only) with the template
+    claim = template.model_copy()
+    _apply_patch(claim, patch)
+    report = check_claim(claim)
+
+    # Check if issue was detected (either in missing evidence or contradictions)
+    return bool(report.missing_required_evidence or report.contradictions)
+
+
+def test_detection_rate_on_known_issues(complete_claim_template):
     """Verify ≥80% detection rate on injected issues."""
 
-    # Create claims with known issues
-    test_cases = [
-        ("no_photos", lambda c: setattr(c.evidence, "has_damage_photos", False)),
-        ("unknown_damage_type", lambda c: setattr(c.incident, "damage_type", DamageType.UNKNOWN)),
-        ("unknown_property_type", lambda c: setattr(c.property_damage, "property_type", PropertyType.UNKNOWN)),
-        ("no_description", lambda c: setattr(c.incident, "incident_description", None)),
-        ("no_location", lambda c: setattr(c.incident, "incident_location", None)),
-        ("no_date", lambda c: setattr(c.incident, "incident_date", None)),
-        ("no_cost", lambda c: setattr(c.property_damage, "estimated_repair_cost", None)),
-        ("future_date", lambda c: setattr(c.incident, "incident_date", datetime.utcnow() + timedelta(days=10))),
-        ("old_date", lambda c: setattr(c.incident, "incident_date", datetime.utcnow() - timedelta(days=800))),
-        ("severe_low_cost", lambda c: (
-            setattr(c.property_damage, "damage_severity", DamageSeverity.SEVERE),
-            setattr(c.property_damage, "estimated_repair_cost", 500.0)
-        )),
-    ]
+    test_cases = _INJECTION_CASES
 
     detected = 0
     total = len(test_cases)
 
-    for issue_name, inject_issue in test_cases:
-        claim = create_complete_claim()
-        inject_issue(claim)
-        report = check_claim(claim)
-
-        # Check if issue was detected (either in missing evidence or contradictions)
-        issue_detected = (
-            len(report.missing_required_evidence) > 0
-            or len(report.contradictions) > 0
-        )
-
-        if issue_detected:
+    for _, patch in test_cases:
+        if _issue_detected(complete_claim_template, patch):
             detected += 1
 
     detection_rate = detected / total
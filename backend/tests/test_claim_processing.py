@@ -10,6 +10,9 @@ Demonstrates how claims are processed through:
 """
 
 import asyncio
+import io
+import sys
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,8 +20,8 @@ load_dotenv()
 from src.routing import process_completed_call
 
 
-# Sample property damage claims
-SAMPLE_CLAIMS = {
+# Sample property damage claims (read-only; shared by the concurrent runs in main)
+SAMPLE_CLAIMS = MappingProxyType({
     "complete_water_damage": {
         "claim_id": "CLM-2024-001",
         "claimant": {
@@ -138,37 +141,43 @@ SAMPLE_CLAIMS = {
             "has_incident_report": True,
         },
     },
-}
+})
 
 
-async def test_claim(name: str, claim_data: dict):
-    """Process a single test claim."""
-    print(f"\n{'='*60}")
-    print(f"Processing: {name}")
-    print(f"{'='*60}")
+async def test_claim(name: str, claim_data: dict) -> tuple[dict, str]:
+    """
+    Process a single test claim.
+
+    Output is buffered and returned with the result so that claims processed
+    concurrently don't interleave their reports.
+    """
+    out = io.StringIO()
+    print(f"\n{'='*60}", file=out)
+    print(f"Processing: {name}", file=out)
+    print(f"{'='*60}", file=out)
     
     result = await process_completed_call(claim_data, call_sid=f"test-{name}")
     
-    print(f"\nResults:")
-    print(f"  Complete: {result['is_complete']}")
+    print(f"\nResults:", file=out)
+    print(f"  Complete: {result['is_complete']}", file=out)
     if result['missing_fields']:
-        print(f"  Missing: {result['missing_fields']}")
+        print(f"  Missing: {result['missing_fields']}", file=out)
     if result['validation_errors']:
-        print(f"  Errors: {result['validation_errors']}")
-    print(f"  Fraud Score: {result['fraud_score']:.2f}")
+        print(f"  Errors: {result['validation_errors']}", file=out)
+    print(f"  Fraud Score: {result['fraud_score']:.2f}", file=out)
     if result['fraud_indicators']:
-        print(f"  Fraud Indicators:")
+        print(f"  Fraud Indicators:", file=out)
         for indicator in result['fraud_indicators']:
-            print(f"    - {indicator}")
-    print(f"  Priority: {result['priority']}")
-    print(f"  Routing: {result['routing_decision']}")
-    print(f"  Reason: {result['routing_reason']}")
-    print(f"  Status: {result['final_status']}")
-    print(f"  Next Actions:")
+            print(f"    - {indicator}", file=out)
+    print(f"  Priority: {result['priority']}", file=out)
+    print(f"  Routing: {result['routing_decision']}", file=out)
+    print(f"  Reason: {result['routing_reason']}", file=out)
+    print(f"  Status: {result['final_status']}", file=out)
+    print(f"  Next Actions:", file=out)
     for action in result['next_actions']:
-        print(f"    - {action}")
+        print(f"    - {action}", file=out)
     
-    return result
+    return result, out.getvalue()
 
 
 async def main():
@@ -177,18 +186,27 @@ async def main():
     print("Property Damage Claim Processing Test")
     print("="*60)
     
+    # Claims are independent (fraud analysis is an LLM call), so process them concurrently
+    names = list(SAMPLE_CLAIMS)
+    outcomes = await asyncio.gather(*(test_claim(name, SAMPLE_CLAIMS[name]) for name in names))
+    
     results = {}
-    for name, claim_data in SAMPLE_CLAIMS.items():
-        results[name] = await test_claim(name, claim_data)
+    for name, (result, report) in zip(names, outcomes):
+        print(report, end="")
+        results[name] = result
     
     # Summary
     print(f"\n\n{'='*60}")
     print("SUMMARY")
     print(f"{'='*60}")
-    print(f"{'Claim':<30} {'Routing':<20} {'Fraud':<8} {'Priority':<10}")
-    print("-"*70)
-    for name, result in results.items():
-        print(f"{name:<30} {result['routing_decision']:<20} {result['fraud_score']:.2f}     {result['priority']:<10}")
+    sys.stdout.writelines([
+        f"{'Claim':<30} {'Routing':<20} {'Fraud':<8} {'Priority':<10}\n",
+        "-"*70 + "\n",
+        *(
+            f"{name:<30} {result['routing_decision']:<20} {result['fraud_score']:.2f}     {result['priority']:<10}\n"
+            for name, result in results.items()
+        ),
+    ])
 
 
 if __name__ == "__main__":
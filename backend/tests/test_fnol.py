@@ -1,8 +1,10 @@
 """Test script for FNOL module."""
 
-from src.fnol import FNOLClaim, FNOLStateManager, LossType, ReporterRole
 
 def test_fnol_module():
+    # Imported here so collecting this module doesn't load the FNOL stack
+    from src.fnol import FNOLClaim, FNOLStateManager, LossType, ReporterRole
+
     # Test 1: Create FNOL State Manager
     print("Test 1: Creating FNOLStateManager...")
     manager = FNOLStateManager()
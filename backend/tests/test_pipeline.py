@@ -9,47 +9,60 @@ Tests parse_claim() with 10+ test fixtures, validates:
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
+from src.fnol import pipeline as pipeline_module
 from src.fnol.config import ExtractionConfig
 from src.fnol.pipeline import ExtractionPipeline, parse_claim
 from src.fnol.schema import DamageSeverity, DamageType, PropertyDamageClaim, PropertyType
 
 
-# Setup logging for tests
-logging.basicConfig(level=logging.INFO)
-
-
 # ============================================================================
 # Fixtures
 # ============================================================================
 
 
-@pytest.fixture
+_FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+# Built once at import; no test modifies the config
+_MOCK_CONFIG = ExtractionConfig(llm_provider="mock")
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Get fixtures directory path."""
-    return Path(__file__).parent.parent / "fixtures"
+    return _FIXTURES_DIR
+
 
+@pytest.fixture(scope="session")
+def fixture_images(fixtures_dir):
+    """Image fixture paths as strings, keyed by file name."""
+    return {p.name: str(p) for p in fixtures_dir.iterdir() if p.suffix == ".jpg"}
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_config():
-    """Create mock configuration (no API keys needed)."""
-    return ExtractionConfig(llm_provider="mock")
+    """Mock configuration (no API keys needed)."""
+    return _MOCK_CONFIG
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pipeline(mock_config):
-    """Create extraction pipeline with mock LLM."""
+    """Create extraction pipeline with mock LLM (stateless between calls, so shared)."""
     return ExtractionPipeline(mock_config)
 
 
+@lru_cache(maxsize=32)
+def _read_fixture_cached(path: str) -> str:
+    return Path(path).read_text(encoding='utf-8').strip()
+
+
 def read_fixture(fixtures_dir: Path, filename: str) -> str:
-    """Read text fixture file."""
-    filepath = fixtures_dir / filename
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return f.read().strip()
+    """Read text fixture file (cached; several tests share the same file)."""
+    return _read_fixture_cached(str(fixtures_dir / filename))
 
 
 # ============================================================================
@@ -72,13 +85,13 @@ class TestSchemaValidation:
         assert claim.claim_id
         assert claim.schema_version == "1.0.0"
 
-    def test_with_images_validates(self, pipeline, fixtures_dir):
+    def test_with_images_validates(self, pipeline, fixture_images):
         """Test parsing with images validates."""
         claim = pipeline.parse_claim(
             text="Ceiling damage from water leak",
             image_paths=[
-                str(fixtures_dir / "damage_photo1.jpg"),
-                str(fixtures_dir / "damage_ceiling.jpg")
+                fixture_images["damage_photo1.jpg"],
+                fixture_images["damage_ceiling.jpg"]
             ]
         )
 
@@ -167,10 +180,8 @@ class TestLatencyMeasurement:
             )
 
         # Check logs for timing info
-        log_messages = [record.message for record in caplog.records]
-        timing_logs = [msg for msg in log_messages if 'time' in msg.lower()]
-
-        assert len(timing_logs) > 0, "No timing information logged"
+        assert any('time' in record.message.lower() for record in caplog.records), \
+            "No timing information logged"
 
     def test_extraction_completes_reasonable_time(self, pipeline):
         """Test extraction completes in reasonable time (mock should be fast)."""
@@ -196,8 +207,7 @@ class TestLatencyMeasurement:
             )
 
         # Look for metrics log
-        metrics_logs = [r for r in caplog.records if 'metrics' in r.message.lower()]
-        assert len(metrics_logs) > 0, "Metrics not logged"
+        assert any('metrics' in r.message.lower() for r in caplog.records), "Metrics not logged"
 
 
 # ============================================================================
@@ -205,172 +215,159 @@ class TestLatencyMeasurement:
 # ============================================================================
 
 
-class TestFixtures:
-    """Test all 10 fixture files."""
-
-    def test_fixture01_water_damage(self, pipeline, fixtures_dir):
-        """Test claim01: Complete water damage."""
-        text = read_fixture(fixtures_dir, "claim01_water_damage.txt")
-        images = [str(fixtures_dir / "damage_ceiling.jpg")]
-
-        claim = pipeline.parse_claim(text, images)
-
-        assert claim.incident.damage_type == DamageType.WATER
-        assert claim.property_damage.property_type in [PropertyType.CEILING, PropertyType.UNKNOWN]
-        assert claim.evidence.has_damage_photos
-        # Mock extractor should detect 'ceiling' in text
-        assert claim.property_damage.room_location in [None, 'living room'] or 'living' in text.lower()
-
-    def test_fixture02_broken_window(self, pipeline, fixtures_dir):
-        """Test claim02: Broken window."""
-        text = read_fixture(fixtures_dir, "claim02_broken_window.txt")
-        images = [str(fixtures_dir / "broken_window.jpg")]
-
-        claim = pipeline.parse_claim(text, images)
-
-        # Mock may classify as WEATHER (due to "outside") or IMPACT ("broken")
-        assert claim.incident.damage_type in [DamageType.IMPACT, DamageType.WEATHER, DamageType.UNKNOWN]
-        assert claim.evidence.has_damage_photos
-
-    def test_fixture03_fire_damage(self, pipeline, fixtures_dir):
-        """Test claim03: Severe fire damage."""
-        text = read_fixture(fixtures_dir, "claim03_fire_damage.txt")
-        images = [
-            str(fixtures_dir / "fire_damage1.jpg"),
-            str(fixtures_dir / "fire_damage2.jpg")
-        ]
-
-        claim = pipeline.parse_claim(text, images)
-
-        assert claim.incident.damage_type == DamageType.FIRE
-        assert claim.evidence.damage_photo_count == 2
-        # Should detect severity keywords
-        assert claim.property_damage.damage_severity in [
-            DamageSeverity.SEVERE, DamageSeverity.UNKNOWN
-        ]
-
-    def test_fixture04_storm_roof(self, pipeline, fixtures_dir):
-        """Test claim04: Storm roof damage, missing cost."""
-        text = read_fixture(fixtures_dir, "claim04_storm_roof.txt")
-        images = [str(fixtures_dir / "roof_damage.jpg")]
-
-        claim = pipeline.parse_claim(text, images)
-
-        # Mock may classify as WATER (due to "water damage" mention) or WEATHER
-        assert claim.incident.damage_type in [DamageType.WEATHER, DamageType.WATER, DamageType.UNKNOWN]
-        assert claim.property_damage.property_type in [PropertyType.ROOF, PropertyType.UNKNOWN]
-        # Missing cost estimate
-        assert "repair_estimate" in claim.evidence.missing_evidence or \
-               claim.property_damage.estimated_repair_cost is None
+def _check_water_damage(claim, text):
+    assert claim.evidence.has_damage_photos
+    # Mock extractor should detect 'ceiling' in text
+    assert claim.property_damage.room_location in [None, 'living room'] or 'living' in text.lower()
+
+
+def _check_has_photos(claim, text):
+    assert claim.evidence.has_damage_photos
+
+
+def _check_fire_damage(claim, text):
+    assert claim.evidence.damage_photo_count == 2
+    # Should detect severity keywords
+    assert claim.property_damage.damage_severity in [
+        DamageSeverity.SEVERE, DamageSeverity.UNKNOWN
+    ]
+
+
+def _check_missing_cost_flagged(claim, text):
+    assert "repair_estimate" in claim.evidence.missing_evidence or \
+           claim.property_damage.estimated_repair_cost is None
+
+
+def _check_minimal_info(claim, text):
+    # Should still validate
+    assert isinstance(claim, PropertyDamageClaim)
+    # But many fields should be unknown or missing
+    assert not claim.evidence.has_damage_photos
+    # Should have consistency issues due to missing info
+    assert len(claim.consistency.conflict_details) > 0
+
+
+def _check_minor_severity(claim, text):
+    assert claim.property_damage.damage_severity in [
+        DamageSeverity.MINOR, DamageSeverity.UNKNOWN
+    ]
+
+
+def _check_ambiguous(claim, text):
+    # Should still validate but with low confidence
+    assert isinstance(claim, PropertyDamageClaim)
+    # Most fields should be unknown
+    assert claim.incident.damage_type == DamageType.UNKNOWN or \
+           claim.incident.damage_type_provenance.confidence < 0.5
+    # Should flag issues
+    assert len(claim.consistency.conflict_details) > 0
+
+
+def _check_no_cost(claim, text):
+    # No cost should be None
+    assert claim.property_damage.estimated_repair_cost is None
+    # Should note missing estimate
+    assert any('cost' in issue.lower() for issue in claim.consistency.conflict_details)
+
+
+# (fixture file, images, allowed damage types, allowed property types, extra check);
+# None skips that check
+FIXTURE_CASES = [
+    # Complete water damage
+    ("claim01_water_damage.txt", ["damage_ceiling.jpg"],
+     {DamageType.WATER}, {PropertyType.CEILING, PropertyType.UNKNOWN}, _check_water_damage),
+    # Broken window; mock may classify as WEATHER (due to "outside") or IMPACT ("broken")
+    ("claim02_broken_window.txt", ["broken_window.jpg"],
+     {DamageType.IMPACT, DamageType.WEATHER, DamageType.UNKNOWN}, None, _check_has_photos),
+    # Severe fire damage
+    ("claim03_fire_damage.txt", ["fire_damage1.jpg", "fire_damage2.jpg"],
+     {DamageType.FIRE}, None, _check_fire_damage),
+    # Storm roof damage, missing cost; mock may classify as WATER (due to "water damage" mention)
+    ("claim04_storm_roof.txt", ["roof_damage.jpg"],
+     {DamageType.WEATHER, DamageType.WATER, DamageType.UNKNOWN}, {PropertyType.ROOF, PropertyType.UNKNOWN},
+     _check_missing_cost_flagged),
+    # Vandalism with police report; mock may classify as IMPACT (due to "kicked", "broken")
+    ("claim05_vandalism_door.txt", ["door_damage.jpg"],
+     {DamageType.VANDALISM, DamageType.IMPACT, DamageType.UNKNOWN}, {PropertyType.DOOR, PropertyType.UNKNOWN},
+     None),
+    # Minimal information (edge case)
+    ("claim06_minimal_info.txt", [], None, None, _check_minimal_info),
+    # Detailed water damage from appliance
+    ("claim07_detailed_water.txt", ["floor_damage.jpg"],
+     {DamageType.WATER}, {PropertyType.FLOOR, PropertyType.UNKNOWN}, None),
+    # Minor wall damage
+    ("claim08_wall_damage.txt", [],
+     {DamageType.IMPACT, DamageType.UNKNOWN}, {PropertyType.WALL, PropertyType.UNKNOWN}, _check_minor_severity),
+    # Very ambiguous description
+    ("claim09_ambiguous.txt", [], None, None, _check_ambiguous),
+    # No cost estimate provided; mock may classify as WATER (due to "water intrusion" mention)
+    ("claim10_no_cost.txt", ["roof_damage.jpg"],
+     {DamageType.WEATHER, DamageType.WATER, DamageType.UNKNOWN}, None, _check_no_cost),
+]
 
-    def test_fixture05_vandalism_door(self, pipeline, fixtures_dir):
-        """Test claim05: Vandalism with police report."""
-        text = read_fixture(fixtures_dir, "claim05_vandalism_door.txt")
-        images = [str(fixtures_dir / "door_damage.jpg")]
 
-        claim = pipeline.parse_claim(text, images)
-
-        # Mock may classify as IMPACT (due to "kicked", "broken") or VANDALISM
-        assert claim.incident.damage_type in [DamageType.VANDALISM, DamageType.IMPACT, DamageType.UNKNOWN]
-        assert claim.property_damage.property_type in [PropertyType.DOOR, PropertyType.UNKNOWN]
-
-    def test_fixture06_minimal_info(self, pipeline, fixtures_dir):
-        """Test claim06: Minimal information (edge case)."""
-        text = read_fixture(fixtures_dir, "claim06_minimal_info.txt")
-        images = []
-
-        claim = pipeline.parse_claim(text, images)
-
-        # Should still validate
-        assert isinstance(claim, PropertyDamageClaim)
-        # But many fields should be unknown or missing
-        assert not claim.evidence.has_damage_photos
-        # Should have consistency issues due to missing info
-        assert len(claim.consistency.conflict_details) > 0
+class TestFixtures:
+    """Test all 10 fixture files."""
 
-    def test_fixture07_detailed_water(self, pipeline, fixtures_dir):
-        """Test claim07: Detailed water damage from appliance."""
-        text = read_fixture(fixtures_dir, "claim07_detailed_water.txt")
-        images = [str(fixtures_dir / "floor_damage.jpg")]
+    @pytest.mark.parametrize("case", FIXTURE_CASES, ids=[case[0].removesuffix(".txt") for case in FIXTURE_CASES])
+    def test_fixture(self, pipeline, fixtures_dir, fixture_images, case):
+        filename, image_names, damage_types, property_types, extra_check = case
+        text = read_fixture(fixtures_dir, filename)
+        images = [fixture_images[name] for name in image_names]
 
         claim = pipeline.parse_claim(text, images)
 
-        assert claim.incident.damage_type == DamageType.WATER
-        assert claim.property_damage.property_type in [PropertyType.FLOOR, PropertyType.UNKNOWN]
-
-    def test_fixture08_wall_damage(self, pipeline, fixtures_dir):
-        """Test claim08: Minor wall damage."""
-        text = read_fixture(fixtures_dir, "claim08_wall_damage.txt")
-        images = []
+        if damage_types is not None:
+            assert claim.incident.damage_type in damage_types
+        if property_types is not None:
+            assert claim.property_damage.property_type in property_types
+        if extra_check is not None:
+            extra_check(claim, text)
 
-        claim = pipeline.parse_claim(text, images)
 
-        assert claim.incident.damage_type in [DamageType.IMPACT, DamageType.UNKNOWN]
-        assert claim.property_damage.property_type in [PropertyType.WALL, PropertyType.UNKNOWN]
-        assert claim.property_damage.damage_severity in [
-            DamageSeverity.MINOR, DamageSeverity.UNKNOWN
-        ]
+# ============================================================================
+# Test: Edge Cases
+# ============================================================================
 
-    def test_fixture09_ambiguous(self, pipeline, fixtures_dir):
-        """Test claim09: Very ambiguous description."""
-        text = read_fixture(fixtures_dir, "claim09_ambiguous.txt")
-        images = []
 
-        claim = pipeline.parse_claim(text, images)
+def _check_unknown_damage_type(claim):
+    assert claim.incident.damage_type == DamageType.UNKNOWN
 
-        # Should still validate but with low confidence
-        assert isinstance(claim, PropertyDamageClaim)
-        # Most fields should be unknown
-        assert claim.incident.damage_type == DamageType.UNKNOWN or \
-               claim.incident.damage_type_provenance.confidence < 0.5
-        # Should flag issues
-        assert len(claim.consistency.conflict_details) > 0
 
-    def test_fixture10_no_cost(self, pipeline, fixtures_dir):
-        """Test claim10: No cost estimate provided."""
-        text = read_fixture(fixtures_dir, "claim10_no_cost.txt")
-        images = [str(fixtures_dir / "roof_damage.jpg")]
+def _check_no_damage_photos(claim):
+    # Image shouldn't count as damage photo
+    assert not claim.evidence.has_damage_photos
 
-        claim = pipeline.parse_claim(text, images)
 
-        # Mock may classify as WATER (due to "water intrusion" mention) or WEATHER
-        assert claim.incident.damage_type in [DamageType.WEATHER, DamageType.WATER, DamageType.UNKNOWN]
-        # No cost should be None
-        assert claim.property_damage.estimated_repair_cost is None
-        # Should note missing estimate
-        assert any('cost' in issue.lower() for issue in claim.consistency.conflict_details)
+def _check_water_or_unknown(claim):
+    assert claim.incident.damage_type in [DamageType.WATER, DamageType.UNKNOWN]
 
 
-# ============================================================================
-# Test: Edge Cases
-# ============================================================================
+# (text, image paths, extra check); every case must still produce a valid claim
+EDGE_CASES = [
+    pytest.param("", [], _check_unknown_damage_type, id="empty_text"),
+    pytest.param("Water damage", ["nonexistent_file.jpg"], _check_no_damage_photos, id="nonexistent_image"),
+    pytest.param(
+        "Água danificou o teto na residência José García-López, São Paulo", [], None, id="unicode_text"
+    ),
+    pytest.param("Water damage " * 200, [], _check_water_or_unknown, id="very_long_text"),  # 2600 chars
+]
 
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_empty_text(self, pipeline):
-        """Test with empty text."""
-        claim = pipeline.parse_claim(text="", image_paths=[])
-
-        assert isinstance(claim, PropertyDamageClaim)
-        assert claim.incident.damage_type == DamageType.UNKNOWN
-
-    def test_nonexistent_image(self, pipeline):
-        """Test with non-existent image path."""
-        claim = pipeline.parse_claim(
-            text="Water damage",
-            image_paths=["nonexistent_file.jpg"]
-        )
+    @pytest.mark.parametrize("text,images,check", EDGE_CASES)
+    def test_parse_validates(self, pipeline, text, images, check):
+        claim = pipeline.parse_claim(text, images)
 
-        # Should still complete
         assert isinstance(claim, PropertyDamageClaim)
-        # Image shouldn't count as damage photo
-        assert not claim.evidence.has_damage_photos
+        if check is not None:
+            check(claim)
 
-    def test_many_images(self, pipeline, fixtures_dir):
+    def test_many_images(self, pipeline, fixture_images):
         """Test with many images."""
-        images = [str(fixtures_dir / f) for f in [
+        images = [fixture_images[f] for f in [
             "damage_photo1.jpg",
             "damage_photo2.jpg",
             "damage_ceiling.jpg",
@@ -385,23 +382,6 @@ class TestEdgeCases:
 
         assert claim.evidence.damage_photo_count == 5
 
-    def test_unicode_text(self, pipeline):
-        """Test with unicode characters."""
-        text = "Água danificou o teto na residência José García-López, São Paulo"
-
-        claim = pipeline.parse_claim(text, [])
-
-        assert isinstance(claim, PropertyDamageClaim)
-
-    def test_very_long_text(self, pipeline):
-        """Test with very long description."""
-        text = ("Water damage " * 200)  # 2600 chars
-
-        claim = pipeline.parse_claim(text, [])
-
-        assert isinstance(claim, PropertyDamageClaim)
-        assert claim.incident.damage_type in [DamageType.WATER, DamageType.UNKNOWN]
-
 
 # ============================================================================
 # Test: Convenience API
@@ -449,13 +429,13 @@ class TestEvidenceChecklist:
         assert not claim.evidence.has_repair_estimate
         assert len(claim.evidence.missing_evidence) >= 2  # At least photos and estimate
 
-    def test_damage_photos_detected(self, pipeline, fixtures_dir):
+    def test_damage_photos_detected(self, pipeline, fixture_images):
         """Test damage photos are detected."""
         claim = pipeline.parse_claim(
             text="Water damage",
             image_paths=[
-                str(fixtures_dir / "damage_photo1.jpg"),
-                str(fixtures_dir / "damage_ceiling.jpg")
+                fixture_images["damage_photo1.jpg"],
+                fixture_images["damage_ceiling.jpg"]
             ]
         )
 
@@ -463,11 +443,11 @@ class TestEvidenceChecklist:
         assert claim.evidence.damage_photo_count == 2
         assert "damage_photos" not in claim.evidence.missing_evidence
 
-    def test_receipt_detected(self, pipeline, fixtures_dir):
+    def test_receipt_detected(self, pipeline, fixture_images):
         """Test receipt/estimate is detected."""
         claim = pipeline.parse_claim(
             text="Repair needed",
-            image_paths=[str(fixtures_dir / "receipt_estimate.jpg")]
+            image_paths=[fixture_images["receipt_estimate.jpg"]]
         )
 
         assert claim.evidence.has_repair_estimate
@@ -502,15 +482,79 @@ class TestConsistencyChecking:
         conflicts = claim.consistency.conflict_details
         assert any('photo' in c.lower() for c in conflicts)
 
-    def test_complete_claim_fewer_issues(self, pipeline, fixtures_dir):
+    def test_complete_claim_fewer_issues(self, pipeline, fixtures_dir, fixture_images):
         """Test complete claim has fewer consistency issues."""
         text = read_fixture(fixtures_dir, "claim01_water_damage.txt")
         images = [
-            str(fixtures_dir / "damage_ceiling.jpg"),
-            str(fixtures_dir / "damage_photo1.jpg")
+            fixture_images["damage_ceiling.jpg"],
+            fixture_images["damage_photo1.jpg"]
         ]
 
         claim = pipeline.parse_claim(text, images)
 
         # Should have fewer issues than minimal claims
         assert len(claim.consistency.conflict_details) < 3
+
+
+# ============================================================================
+# Test: Extraction Cache
+# ============================================================================
+
+
+class TestExtractionCache:
+    """Test the opt-in per-pipeline extraction cache."""
+
+    @pytest.fixture
+    def cached_pipeline(self, monkeypatch):
+        """Cache-enabled pipeline holding two entries, counting text extractions."""
+        monkeypatch.setattr(pipeline_module, "_CLAIM_CACHE_SIZE", 2)
+        cached = ExtractionPipeline(ExtractionConfig(llm_provider="mock", cache_enabled=True))
+        cached.extract_calls = 0
+        extract = cached.text_extractor.extract
+
+        def counting_extract(text):
+            cached.extract_calls += 1
+            return extract(text)
+
+        monkeypatch.setattr(cached.text_extractor, "extract", counting_extract)
+        return cached
+
+    def test_hit_returns_copy_with_new_claim_id(self, cached_pipeline):
+        """A repeated input skips extraction but is still a separate claim."""
+        first = cached_pipeline.parse_claim("Shipment misrouted to the wrong hub", [])
+        second = cached_pipeline.parse_claim("Shipment misrouted to the wrong hub", [])
+
+        assert cached_pipeline.extract_calls == 1
+        assert second.claim_id != first.claim_id
+        assert second.incident.incident_type == first.incident.incident_type
+        assert second.incident is not first.incident
+
+    def test_miss_on_different_input(self, cached_pipeline):
+        """Different text is extracted again."""
+        cached_pipeline.parse_claim("Shipment misrouted to the wrong hub", [])
+        cached_pipeline.parse_claim("Package delayed past the SLA", [])
+
+        assert cached_pipeline.extract_calls == 2
+
+    def test_replaced_image_misses(self, cached_pipeline, tmp_path):
+        """Re-uploading an image at the same path invalidates the entry."""
+        image = tmp_path / "log.json"
+        image.write_text('{"event": "misroute"}')
+        cached_pipeline.parse_claim("Shipment misrouted", [str(image)])
+
+        image.write_text('{"event": "misroute", "hub": "HUB-NYC-01"}')
+        cached_pipeline.parse_claim("Shipment misrouted", [str(image)])
+
+        assert cached_pipeline.extract_calls == 2
+
+    def test_least_recently_used_evicted(self, cached_pipeline):
+        """Past the size limit the least recently used input is dropped."""
+        for text in ("Shipment misrouted", "Package delayed", "Container lost"):
+            cached_pipeline.parse_claim(text, [])
+        assert cached_pipeline.extract_calls == 3
+
+        cached_pipeline.parse_claim("Container lost", [])
+        assert cached_pipeline.extract_calls == 3
+
+        cached_pipeline.parse_claim("Shipment misrouted", [])
+        assert cached_pipeline.extract_calls == 4
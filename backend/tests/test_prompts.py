@@ -0,0 +1,31 @@
+"""Tests for the voice agent prompts."""
+
+import os
+os.environ.setdefault("OPENAI_API_KEY", "test-key-for-import-only")
+
+from src.voice.prompts import VOICE_AGENT_BASE_PROMPT, VOICE_AGENT_PROMPT_COMPACT, get_voice_agent_prompt
+
+# Prefill budget for the Realtime session instructions (~4 characters per token)
+COMPACT_PROMPT_TOKEN_BUDGET = 500
+
+
+def test_compact_prompt_within_token_budget():
+    assert len(VOICE_AGENT_PROMPT_COMPACT) // 4 < COMPACT_PROMPT_TOKEN_BUDGET
+
+
+def test_compact_prompt_keeps_required_guidance():
+    for section in ("VERIFY NAME AND POLICY FIRST", "POLICY CHECK", "IF INTERRUPTED", "COLLECT", "ENDING"):
+        assert section in VOICE_AGENT_PROMPT_COMPACT
+
+
+def test_call_context_is_appended_after_static_prefix():
+    prompt = get_voice_agent_prompt(["policy_number"], "What's your policy number?", "Policy not found")
+    assert prompt.startswith(VOICE_AGENT_BASE_PROMPT)
+    assert get_voice_agent_prompt() is VOICE_AGENT_BASE_PROMPT
+
+
+def test_prompt_is_memoized_per_call_context():
+    fields = ["damage_type", "incident_date", "address", "description", "severity", "repair_cost"]
+    first = get_voice_agent_prompt(fields, "When did it happen?")
+    # Only the first five missing fields are shown, so they are all the cache key uses
+    assert get_voice_agent_prompt(fields[:5], "When did it happen?") is first